@@ -6,10 +6,12 @@ This script runs standardized benchmarks and outputs results in a format
 suitable for CI/CD performance tracking.
 """
 
+import gc
 import time
 import random
 import json
 import sys
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Any
 
@@ -27,13 +29,30 @@ class BenchmarkSuite:
     def __init__(self, size: int = 10000):
         self.size = size
         self.results = {}
+        # Formatted once so the timed loops measure the tree, not f-strings
+        self.values = [f"value_{i}" for i in range(size)]
+
+    @staticmethod
+    def measure(operation):
+        """Run an operation once and return (duration_seconds, result).
+
+        The garbage collector is paused while the operation runs so a
+        collection triggered by earlier allocations does not land in the
+        measurement.
+        """
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            result = operation()
+            duration = (time.perf_counter_ns() - start) / 1e9
+        finally:
+            gc.enable()
+        return duration, result
 
     def time_operation(self, name: str, operation):
         """Time an operation and store the result."""
-        start = time.perf_counter()
-        result = operation()
-        end = time.perf_counter()
-        duration = end - start
+        duration, result = self.measure(operation)
 
         self.results[name] = {
             "duration": duration,
@@ -47,22 +66,40 @@ class BenchmarkSuite:
         """Benchmark sequential insertions."""
         tree = BPlusTreeMap()
 
+        values = self.values
+        # Bound once so the loop skips the per-call __setitem__ slot lookup
+        setitem = tree.__setitem__
+
         def insert_sequential():
-            for i in range(self.size):
-                tree[i] = f"value_{i}"
+            for i, value in enumerate(values):
+                setitem(i, value)
             return tree
 
         return self.time_operation("sequential_insertion", insert_sequential)
 
+    def benchmark_bulk_load(self):
+        """Benchmark bottom-up construction from sorted items."""
+        # Built outside the timed region so only the tree construction counts
+        items = list(enumerate(self.values))
+
+        def bulk_load():
+            return BPlusTreeMap.from_sorted_items(items)
+
+        return self.time_operation("bulk_load", bulk_load)
+
     def benchmark_random_insertion(self):
         """Benchmark random insertions."""
         tree = BPlusTreeMap()
         keys = list(range(self.size))
         random.shuffle(keys)
+        # Parallel key and value lists rather than a list of pairs, so the
+        # setup allocates no per-item tuples
+        values = [self.values[key] for key in keys]
+        setitem = tree.__setitem__
 
         def insert_random():
-            for key in keys:
-                tree[key] = f"value_{key}"
+            for key, value in zip(keys, values):
+                setitem(key, value)
             return tree
 
         return self.time_operation("random_insertion", insert_random)
@@ -71,10 +108,11 @@ class BenchmarkSuite:
         """Benchmark lookups on existing tree."""
         keys = list(range(self.size))
         random.shuffle(keys)
+        getitem = tree.__getitem__
 
         def perform_lookups():
             for key in keys:
-                _ = tree[key]
+                getitem(key)
 
         self.time_operation("random_lookups", perform_lookups)
 
@@ -83,12 +121,14 @@ class BenchmarkSuite:
         # Test 10% range queries
         range_size = self.size // 10
 
+        items = tree.items
+
         def perform_range_queries():
             results = []
             for i in range(10):
                 start = i * range_size
                 end = (i + 1) * range_size
-                results.append(list(tree.items(start, end)))
+                results.append(list(items(start, end)))
             return results
 
         return self.time_operation("range_queries_10_percent", perform_range_queries)
@@ -99,33 +139,41 @@ class BenchmarkSuite:
         def iterate_tree():
             return list(tree.items())
 
+        def drain_tree():
+            # A zero-length deque consumes the iterator without storing
+            # anything, isolating iterator cost from building the list
+            deque(tree.items(), maxlen=0)
+
+        self.time_operation("full_iteration_streamed", drain_tree)
         return self.time_operation("full_iteration", iterate_tree)
 
     def benchmark_deletions(self, tree: BPlusTreeMap):
         """Benchmark deletions."""
         keys = list(range(self.size))
         random.shuffle(keys)
+        delitem = tree.__delitem__
 
         def perform_deletions():
             for key in keys:
-                del tree[key]
+                delitem(key)
 
         self.time_operation("random_deletions", perform_deletions)
 
     def benchmark_dict_comparison(self):
         """Compare with standard dict performance."""
         # B+ Tree sequential
+        values = self.values
         tree = BPlusTreeMap()
         tree_start = time.perf_counter()
-        for i in range(self.size):
-            tree[i] = f"value_{i}"
+        for i, value in enumerate(values):
+            tree[i] = value
         tree_time = time.perf_counter() - tree_start
 
         # Dict sequential
         d = {}
         dict_start = time.perf_counter()
-        for i in range(self.size):
-            d[i] = f"value_{i}"
+        for i, value in enumerate(values):
+            d[i] = value
         dict_time = time.perf_counter() - dict_start
 
         self.results["comparison_vs_dict"] = {
@@ -149,6 +197,40 @@ class BenchmarkSuite:
             "ratio": tree_iter_time / dict_sort_time if dict_sort_time > 0 else 0,
         }
 
+    def benchmark_capacity_sweep(self, capacities=(16, 32, 64, 128, 256)):
+        """Time insertion, lookups, range scans and iteration per node capacity."""
+        values = self.values
+        keys = list(range(self.size))
+        random.shuffle(keys)
+        range_size = self.size // 10
+
+        for capacity in capacities:
+            tree = BPlusTreeMap(capacity=capacity)
+            setitem = tree.__setitem__
+            getitem = tree.__getitem__
+
+            def insert():
+                for i, value in enumerate(values):
+                    setitem(i, value)
+
+            def lookup():
+                for key in keys:
+                    getitem(key)
+
+            def scan_ranges():
+                for start in range(0, self.size, range_size):
+                    deque(tree.items(start, start + range_size), maxlen=0)
+
+            def iterate():
+                deque(tree.items(), maxlen=0)
+
+            self.results[f"capacity_{capacity}"] = {
+                "insertion_time": self.measure(insert)[0],
+                "lookup_time": self.measure(lookup)[0],
+                "range_scan_time": self.measure(scan_ranges)[0],
+                "iteration_time": self.measure(iterate)[0],
+            }
+
     def run_all_benchmarks(self):
         """Run all benchmarks and return results."""
         print(f"Running benchmarks with {self.size:,} items...")
@@ -157,6 +239,10 @@ class BenchmarkSuite:
         print("- Sequential insertion...")
         tree_seq = self.benchmark_sequential_insertion()
 
+        # Bulk load
+        print("- Bulk load...")
+        self.benchmark_bulk_load()
+
         # Random insertion
         print("- Random insertion...")
         tree_rand = self.benchmark_random_insertion()
@@ -181,6 +267,10 @@ class BenchmarkSuite:
         print("- Dictionary comparison...")
         self.benchmark_dict_comparison()
 
+        # Node capacity
+        print("- Capacity sweep...")
+        self.benchmark_capacity_sweep()
+
         return self.results
 
 
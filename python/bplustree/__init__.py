@@ -26,6 +26,40 @@ else:
             else:
                 super().__init__(capacity=capacity)
 
+        @classmethod
+        def from_sorted_items(
+            cls,
+            items,
+            capacity=None,
+            key_typecode=None,
+            value_typecode=None,
+            fill_factor=1.0,
+        ):
+            """Bulk load from sorted key-value pairs.
+
+            Strictly ascending input is built bottom-up in C; anything else
+            is inserted one pair at a time.
+
+            Raises:
+                ValueError: If fill_factor is not in (0, 1], or if a key or
+                    value typecode is given, since the C extension stores
+                    plain Python objects.
+            """
+            if not 0 < fill_factor <= 1:
+                raise ValueError(f"fill_factor must be in (0, 1], got {fill_factor}")
+            if key_typecode is not None or value_typecode is not None:
+                raise ValueError(
+                    "key_typecode and value_typecode are not supported by the "
+                    "C extension"
+                )
+            tree = cls(capacity)
+            if not isinstance(items, (list, tuple)):
+                items = list(items)
+            if not tree._bulk_load(items, fill_factor):
+                for key, value in items:
+                    tree[key] = value
+            return tree
+
         def get(self, key, default=None):
             """Get value with default."""
             try:
@@ -98,11 +132,14 @@ else:
                     self[key] = value
 
         def copy(self):
-            """Create a shallow copy of the tree."""
-            new_tree = BPlusTreeMap(capacity=self.capacity)
-            for key, value in self.items():
-                new_tree[key] = value
-            return new_tree
+            """Create a shallow copy of the tree.
+
+            The items are already in key order, so the copy is bulk loaded
+            bottom-up in C rather than inserted one at a time.
+            """
+            return BPlusTreeMap.from_sorted_items(
+                list(self.items()), capacity=self.capacity
+            )
 
         @property
         def capacity(self):
@@ -6,16 +6,39 @@ supporting efficient insertion, deletion, lookup, and range queries.
 """
 
 import bisect
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Optional, List, Tuple, Union, Iterator
+from array import array
+from itertools import chain, islice
+from operator import itemgetter, lt
+from typing import Any, Callable, Optional, List, Sequence, Tuple, Union, Iterator
 
 __all__ = ["BPlusTreeMap", "Node", "LeafNode", "BranchNode"]
 
 # Constants
 MIN_CAPACITY = 4
 DEFAULT_CAPACITY = 128
-BULK_LOAD_BATCH_MULTIPLIER = 2
-MIN_BULK_LOAD_BATCH_SIZE = 50
+
+
+def _bulk_load_ranges(count: int, size: int, min_size: int) -> List[Tuple[int, int]]:
+    """Split ``count`` entries into full ``(start, end)`` runs of ``size``.
+
+    If the last run would hold fewer than ``min_size`` entries, the last two
+    runs share their entries evenly instead. When ``size`` is below
+    ``2 * min_size`` even that can leave a short run, so all entries are then
+    spread evenly over as many runs as ``min_size`` allows (each run is at
+    most ``2 * min_size`` long).
+    """
+    starts = list(range(0, count, size))
+    if len(starts) > 1 and count - starts[-1] < min_size:
+        combined = count - starts[-2]
+        if combined // 2 >= min_size:
+            starts[-1] = starts[-2] + combined - combined // 2
+        else:
+            runs = min(len(starts), count // min_size)
+            base, extra = divmod(count, runs)
+            starts = [run * base + min(run, extra) for run in range(runs)]
+    return list(zip(starts, starts[1:] + [count]))
 
 
 class BPlusTreeError(Exception):
@@ -40,6 +63,10 @@ class BPlusTreeMap:
 
     Attributes:
         capacity: Maximum number of keys per node.
+        key_typecode: ``array`` typecode used for leaf and branch keys, or
+            None for arbitrary Python keys.
+        value_typecode: ``array`` typecode used for leaf values, or None for
+            arbitrary Python values.
         root: The root node of the tree.
         leaves: The leftmost leaf node (head of linked list).
 
@@ -55,158 +82,295 @@ class BPlusTreeMap:
         2: two
     """
 
-    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        key_typecode: Optional[str] = None,
+        value_typecode: Optional[str] = None,
+    ) -> None:
         """Create a B+ tree with specified node capacity.
 
         Args:
             capacity: Maximum number of keys per node (minimum 4).
+            key_typecode: Optional ``array`` typecode (e.g. ``"q"`` for int64)
+                for trees whose keys are all numbers of one kind. Leaf keys and
+                branch separators are then stored unboxed in an
+                ``array.array`` instead of a list. This saves memory, not
+                time: each comparison during a search re-boxes the element,
+                so int keys in plain lists are searched faster.
+            value_typecode: Optional ``array`` typecode (e.g. ``"d"`` for
+                float64) for trees whose values are all numbers of one kind.
 
         Raises:
             InvalidCapacityError: If capacity is less than 4.
+            ValueError: If a typecode is not a valid ``array`` typecode.
         """
         if capacity < MIN_CAPACITY:
             raise InvalidCapacityError(
                 f"Capacity must be at least {MIN_CAPACITY} to maintain B+ tree invariants"
             )
         self.capacity = capacity
-        self._rightmost_leaf_cache: Optional[LeafNode] = None
-
-        original = LeafNode(self.capacity)
+        self.key_typecode = key_typecode
+        self.value_typecode = value_typecode
+        self._leaf_count = 1
+        # Maintained on every insert and delete so len() is O(1)
+        self._size = 0
+        # Bumped on every insert and delete so range_update can detect
+        # structural changes made by its callback
+        self._modification_count = 0
+
+        original = LeafNode(self.capacity, key_typecode, value_typecode)
         self.leaves: LeafNode = original
         self.root: Node = original
+        # Kept current on every split and merge of the last leaf
+        self._rightmost_leaf: LeafNode = original
 
     @classmethod
     def from_sorted_items(
-        cls, items, capacity: int = DEFAULT_CAPACITY
+        cls,
+        items,
+        capacity: int = DEFAULT_CAPACITY,
+        key_typecode: Optional[str] = None,
+        value_typecode: Optional[str] = None,
+        fill_factor: float = 1.0,
     ) -> "BPlusTreeMap":
         """Bulk load from sorted key-value pairs for 3-5x faster construction.
 
         Args:
             items: Iterable of (key, value) pairs that MUST be sorted by key.
             capacity: Node capacity (minimum 4).
+            key_typecode: Optional ``array`` typecode for leaf keys.
+            value_typecode: Optional ``array`` typecode for leaf values.
+            fill_factor: Fraction of each node to fill, in (0, 1]. Lower values
+                leave room for later inserts before the first splits. Nodes
+                are never filled below their minimum occupancy.
 
         Returns:
             BPlusTreeMap instance with loaded data.
 
         Raises:
             InvalidCapacityError: If capacity is less than 4.
+            ValueError: If fill_factor is not in (0, 1].
         """
-        tree = cls(capacity=capacity)
-        tree._bulk_load_sorted(items)
+        if not 0 < fill_factor <= 1:
+            raise ValueError(f"fill_factor must be in (0, 1], got {fill_factor}")
+        tree = cls(
+            capacity=capacity,
+            key_typecode=key_typecode,
+            value_typecode=value_typecode,
+        )
+        tree._bulk_load_sorted(items, fill_factor)
         return tree
 
-    def _bulk_load_sorted(self, items) -> None:
-        """Internal bulk loading implementation for sorted items."""
-        items_list = list(items)
-        if not items_list:
-            return
-        optimal_batch_size = max(
-            self.capacity * BULK_LOAD_BATCH_MULTIPLIER, MIN_BULK_LOAD_BATCH_SIZE
-        )
+    def _bulk_load_sorted(self, items, fill_factor: float = 1.0) -> None:
+        """Build the tree bottom-up from sorted items (expects an empty tree).
 
-        for i in range(0, len(items_list), optimal_batch_size):
-            batch_end = min(i + optimal_batch_size, len(items_list))
+        Leaves are cut straight from the input, ``fill_factor`` of a node at a
+        time, and chained, so an iterator is consumed lazily and only one
+        leaf's worth of items is held outside the tree. Each branch level is
+        then built over the level below, taking the smallest key of every
+        child but the first as its separators. Once the input stops being
+        strictly ascending, what came before is loaded as above and the rest
+        falls back to per-item insertion.
+        """
+        capacity = self.capacity
+        min_keys = (capacity - 1) // 2
+        per_leaf = max(min_keys, min(capacity, int(capacity * fill_factor)))
+        per_branch = max(
+            min_keys + 1, min(capacity + 1, int((capacity + 1) * fill_factor))
+        )
+        key_typecode = self.key_typecode
+        value_typecode = self.value_typecode
+        first = itemgetter(0)
+        second = itemgetter(1)
+
+        stream = iter(items)
+        rest: Iterator[Tuple[Any, Any]] = iter(())
+        level: List[Node] = []
+        low_keys: List[Any] = []
+        last_key = None
+        size = 0
+        while True:
+            chunk = list(islice(stream, per_leaf))
+            if not chunk:
+                break
+            keys = list(map(first, chunk))
+            # map() drives the pairwise comparison from C, with no per-pair
+            # bytecode
+            if (level and not last_key < keys[0]) or not all(
+                map(lt, keys, islice(keys, 1, None))
+            ):
+                rest = chain(chunk, stream)
+                break
+            values = list(map(second, chunk))
+            leaf = LeafNode(capacity)
+            leaf.keys = keys if key_typecode is None else array(key_typecode, keys)
+            leaf.values = (
+                values if value_typecode is None else array(value_typecode, values)
+            )
+            level.append(leaf)
+            low_keys.append(keys[0])
+            last_key = keys[-1]
+            size += len(keys)
+
+        if level:
+            self._link_bulk_loaded_leaves(level, low_keys, min_keys)
+            self._size = size
+            self._modification_count += 1
+
+            # Branch separators are slices of these, so they share the key type
+            if key_typecode is not None:
+                low_keys = array(key_typecode, low_keys)
+
+            # A branch with k separators has k + 1 children
+            while len(level) > 1:
+                parents: List[Node] = []
+                parent_low_keys = low_keys[:0]
+                for start, end in _bulk_load_ranges(
+                    len(level), per_branch, min_keys + 1
+                ):
+                    branch = BranchNode(capacity)
+                    branch.children = level[start:end]
+                    branch.keys = low_keys[start + 1 : end]
+                    parents.append(branch)
+                    parent_low_keys.append(low_keys[start])
+                level = parents
+                low_keys = parent_low_keys
+
+            self.root = level[0]
+
+        for key, value in rest:
+            self[key] = value
+
+    def _link_bulk_loaded_leaves(
+        self, leaves: List["LeafNode"], low_keys: List[Any], min_keys: int
+    ) -> None:
+        """Chain freshly cut leaves and install them as the tree's leaf level.
+
+        A last leaf below ``min_keys`` shares the entries of the leaf before
+        it evenly, or is folded into it when the two can't both reach
+        ``min_keys``; ``leaves`` and ``low_keys`` are updated to match.
+        """
+        if len(leaves) > 1 and len(leaves[-1].keys) < min_keys:
+            last = leaves.pop()
+            low_keys.pop()
+            left = leaves[-1]
+            keys = left.keys + last.keys
+            values = left.values + last.values
+            mid = len(keys) - len(keys) // 2
+            if len(keys) - mid >= min_keys:
+                right = LeafNode(self.capacity)
+                right.keys = keys[mid:]
+                right.values = values[mid:]
+                leaves.append(right)
+                low_keys.append(keys[mid])
+                keys = keys[:mid]
+                values = values[:mid]
+            left.keys = keys
+            left.values = values
+
+        for left, right in zip(leaves, islice(leaves, 1, None)):
+            left.next = right
+        self.leaves = leaves[0]
+        self._rightmost_leaf = leaves[-1]
+        self._leaf_count = len(leaves)
 
-            for j in range(i, batch_end):
-                key, value = items_list[j]
-                self._insert_sorted_optimized(key, value)
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Set a key-value pair (dict-like API).
 
-    def _insert_sorted_optimized(self, key: Any, value: Any) -> None:
-        """Optimized insertion for sorted data - avoids repeated tree traversals.
+        A key past every key in the tree is appended to the rightmost leaf
+        without a descent, so ascending inserts cost one comparison each.
 
         Args:
-            key: The key to insert.
+            key: The key to insert or update.
             value: The value to associate with the key.
         """
-        if (
-            self._rightmost_leaf_cache
-            and self._rightmost_leaf_cache.keys
-            and key > self._rightmost_leaf_cache.keys[-1]
-            and not self._rightmost_leaf_cache.is_full()
-        ):
-            self._rightmost_leaf_cache.keys.append(key)
-            self._rightmost_leaf_cache.values.append(value)
-            return
-
-        self[key] = value
-        self._update_rightmost_leaf_cache()
+        # _rightmost_leaf always exists, so there is no attribute guard here
+        rightmost = self._rightmost_leaf
+        keys = rightmost.keys
+        path = []
+        if keys and key > keys[-1]:
+            if len(keys) < rightmost.capacity:
+                rightmost.append(key, value)
+                self._size += 1
+                self._modification_count += 1
+                return
 
-    def _update_rightmost_leaf_cache(self) -> None:
-        """Update the rightmost leaf cache."""
-        current = self.leaves
-        while current.next is not None:
-            current = current.next
-        self._rightmost_leaf_cache = current
+            # The full leaf splits. bisect_right would pick the last child at
+            # every level, so build the path down the right spine without
+            # any key comparisons
+            node = self.root
+            while type(node) is BranchNode:
+                children = node.children
+                path.append((node, len(children) - 1))
+                node = children[-1]
+        else:
+            # Descend iteratively, remembering (branch, child_index) for each
+            # level
+            node = self.root
+            bisect_right = bisect.bisect_right
+            while type(node) is BranchNode:
+                child_index = bisect_right(node.keys, key)
+                path.append((node, child_index))
+                node = node.children[child_index]
+
+        result = self._insert_into_leaf(node, key, value)
+        if result is not None:
+            self._propagate_split(path, result)
 
-    def __setitem__(self, key: Any, value: Any) -> None:
-        """Set a key-value pair (dict-like API).
+    def _propagate_split(
+        self, path: List[Tuple["BranchNode", int]], result: Tuple["Node", Any]
+    ) -> None:
+        """Insert a split's (new_node, separator) into the branches on ``path``.
 
-        Args:
-            key: The key to insert or update.
-            value: The value to associate with the key.
+        ``path`` holds the (branch, child_index) pairs from the root down to
+        the node that split. A root split grows the tree by one level.
         """
-        result = self._insert_recursive(self.root, key, value)
+        # Unwind the path, inserting each split's new node into its parent at
+        # the child index recorded on the way down (no second bisect)
+        while result is not None and path:
+            branch, child_index = path.pop()
+            new_child, separator_key = result
+            result = branch.insert_child_and_split_if_needed(
+                child_index, separator_key, new_child
+            )
 
         # If the root split, create a new root
         if result is not None:
             new_node, separator_key = result
-            new_root = BranchNode(self.capacity)
+            new_root = BranchNode(self.capacity, self.key_typecode)
             new_root.keys.append(separator_key)
             new_root.children.append(self.root)
             new_root.children.append(new_node)
             self.root = new_root
 
-    def _insert_recursive(
-        self, node: "Node", key: Any, value: Any
-    ) -> Optional[Tuple["Node", Any]]:
-        """
-        Recursively insert a key-value pair into the tree.
-        Returns None for a simple insertion, or (new_node, separator_key) if a split occurred.
-        """
-        if node.is_leaf():
-            # Base case: insert into leaf
-            return self._insert_into_leaf(node, key, value)
-
-        child_index = node.find_child_index(key)
-        child = node.children[child_index]
-
-        split_result = self._insert_recursive(child, key, value)
-        if split_result is None:
-            return None
-
-        new_child, separator_key = split_result
-        return self._insert_into_branch(node, child_index, separator_key, new_child)
-
     def _insert_into_leaf(
         self, leaf: "LeafNode", key: Any, value: Any
     ) -> Optional[Tuple["LeafNode", Any]]:
         """Insert into a leaf node. Returns None or (new_leaf, separator) if split."""
-        pos, exists = leaf.find_position(key)
+        keys = leaf.keys
+        pos = bisect.bisect_left(keys, key)
 
         # If key exists, just update (no split needed)
-        if exists:
+        if pos < len(keys) and keys[pos] == key:
             leaf.values[pos] = value
             return None
 
-        # If leaf is not full, simple insertion
-        if not leaf.is_full():
-            leaf.insert(key, value)
+        # If leaf is not full, simple insertion at the position found above
+        if len(keys) < leaf.capacity:
+            leaf.insert_at(pos, key, value)
+            self._size += 1
+            self._modification_count += 1
             return None
 
         # Leaf is full, need to split
-        return leaf.split_and_insert(key, value)
-
-    def _insert_into_branch(
-        self,
-        branch: "BranchNode",
-        child_index: int,
-        separator_key: Any,
-        new_child: "Node",
-    ) -> Optional[Tuple["BranchNode", Any]]:
-        """Insert a separator and new child into a branch node. Returns None or (new_branch, separator) if split."""
-        return branch.insert_child_and_split_if_needed(
-            child_index, separator_key, new_child
-        )
+        self._leaf_count += 1
+        result = leaf.split_and_insert(key, value)
+        self._size += 1
+        self._modification_count += 1
+        if leaf is self._rightmost_leaf:
+            self._rightmost_leaf = result[0]
+        return result
 
     def __getitem__(self, key: Any) -> Any:
         """Get value for a key (dict-like API)"""
@@ -228,25 +392,72 @@ class BPlusTreeMap:
         Returns:
             The value associated with the key, or default if not found.
         """
+        # Inlined descent: one bisect per level, no per-level method calls or
+        # structure validation (insert/delete keep the branches well-formed)
         node = self.root
-        while not node.is_leaf():
-            node = node.get_child(key)
+        bisect_right = bisect.bisect_right
+        while type(node) is BranchNode:
+            node = node.children[bisect_right(node.keys, key)]
+
+        keys = node.keys
+        pos = bisect.bisect_left(keys, key)
+        if pos < len(keys) and keys[pos] == key:
+            value = node.values[pos]
+            if value is not None:
+                return value
+        return default
+
+    def get_batch(self, keys, default: Any = None) -> List[Any]:
+        """Look up many keys at once, like ``[self.get(k, default) for k in keys]``.
 
-        value = node.get(key)
-        return value if value is not None else default
+        Batches of at least ``capacity`` keys are visited in sorted order with
+        the leaf cursor used by ``update()`` and ``delete_batch()``, so queries
+        that land in the same or the next leaf skip the descent from the root.
+
+        Args:
+            keys: Iterable of keys to look up.
+            default: Value to return for keys that are not found.
+
+        Returns:
+            The values, in the same order as ``keys``.
+        """
+        if not isinstance(keys, list):
+            keys = list(keys)
+        if len(keys) < self.capacity:
+            return [self.get(key, default) for key in keys]
+
+        results = [default] * len(keys)
+        leaf = None
+        bisect_left = bisect.bisect_left
+        for index in sorted(range(len(keys)), key=keys.__getitem__):
+            key = keys[index]
+            leaf = self._leaf_for_sorted_key(leaf, key)
+            leaf_keys = leaf.keys
+            pos = bisect_left(leaf_keys, key)
+            if pos < len(leaf_keys) and leaf_keys[pos] == key:
+                value = leaf.values[pos]
+                if value is not None:
+                    results[index] = value
+        return results
 
     def __contains__(self, key: Any) -> bool:
         """Check if key exists (for 'in' operator)"""
         node = self.root
-        while not node.is_leaf():
-            node = node.get_child(key)
+        bisect_right = bisect.bisect_right
+        while type(node) is BranchNode:
+            node = node.children[bisect_right(node.keys, key)]
 
-        pos, exists = node.find_position(key)
-        return exists
+        keys = node.keys
+        pos = bisect.bisect_left(keys, key)
+        return pos < len(keys) and keys[pos] == key
 
     def __len__(self) -> int:
         """Return number of key-value pairs"""
-        return self.leaves.key_count()
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over keys in order (dict-like API)"""
+        return self.keys()
 
     def __bool__(self) -> bool:
         """Return True if tree is not empty"""
@@ -254,66 +465,119 @@ class BPlusTreeMap:
 
     def __delitem__(self, key: Any) -> None:
         """Delete a key (dict-like API)"""
-        deleted = self._delete_recursive(self.root, key)
-        if not deleted:
+        if not self._delete(key):
             raise KeyError(key)
 
-    def _delete_recursive(self, node: "Node", key: Any) -> bool:
-        """
-        Recursively delete a key from the tree.
-        Returns True if the key was found and deleted, False otherwise.
-        """
-        if node.is_leaf():
-            # Base case: delete from leaf
-            # Note: underflow handling will be done by parent
-            return self._delete_from_leaf(node, key)
-
-        # Recursive case: find the correct child and recurse
-        child_index = node.find_child_index(key)
-        child = node.children[child_index]
-        deleted = self._delete_recursive(child, key)
-        if not deleted:
-            return False
+    def delete_batch(self, keys, presorted: bool = False) -> int:
+        """Delete many keys, skipping any that are not in the tree.
 
-        # Handle child underflow after deletion
-        if len(child) == 0 or child.is_underfull():
-            # Child is underfull (including completely empty), try redistribution or merging
-            self._handle_underflow(node, child_index)
+        Each delete repairs underflow on its own path as it goes, so the tree
+        is balanced after every key and no compaction pass is needed once the
+        batch is done, however small or large it is.
 
-            # If parent became underfull it will be handled by the calling recursive call.
+        Batches of at least ``capacity`` keys are sorted and walked with a
+        leaf cursor (see ``_leaf_for_sorted_key``): a key whose leaf stays
+        above minimum occupancy is removed in place without a descent, and
+        only deletes that would underflow take the full rebalancing path.
+        Callers that already hold the keys in ascending order (e.g. expiring
+        a time range) can pass ``presorted=True`` to skip the sort and its
+        copy; a key smaller than its predecessor resets the cursor, so
+        out-of-order keys are still deleted, just without saving a descent.
 
-        # Handle root collapse: if root has only one child, make that child the new root
-        if node == self.root and not node.is_leaf() and len(node.children) == 1:
-            self.root = node.children[0]
+        Args:
+            keys: Iterable of keys to delete.
+            presorted: Whether ``keys`` is already in ascending order.
 
+        Returns:
+            The number of keys that were found and deleted.
+        """
+        if not isinstance(keys, list):
+            keys = list(keys)
+
+        deleted = 0
+        if len(keys) < self.capacity:
+            for key in keys:
+                if self._delete(key):
+                    deleted += 1
+            return deleted
+
+        min_keys = (self.capacity - 1) // 2
+        leaf = None
+        previous = None
+        for key in keys if presorted else sorted(keys):
+            if presorted and leaf is not None and key < previous:
+                leaf = None
+            previous = key
+            leaf = self._leaf_for_sorted_key(leaf, key)
+            leaf_keys = leaf.keys
+            pos = bisect.bisect_left(leaf_keys, key)
+            if pos == len(leaf_keys) or leaf_keys[pos] != key:
+                continue
+            if len(leaf_keys) > min_keys:
+                # No underflow: separators stay valid lower bounds, so the
+                # branches above need no change
+                del leaf_keys[pos]
+                del leaf.values[pos]
+                self._size -= 1
+                self._modification_count += 1
+            else:
+                self._delete(key)
+                leaf = None
+            deleted += 1
         return deleted
 
+    def _delete(self, key: Any) -> bool:
+        """Delete a key and rebalance. Returns False if the key was not found."""
+        # Descend iteratively, remembering (branch, child_index) for each level
+        path = []
+        node = self.root
+        bisect_right = bisect.bisect_right
+        while type(node) is BranchNode:
+            child_index = bisect_right(node.keys, key)
+            path.append((node, child_index))
+            node = node.children[child_index]
+
+        if not self._delete_from_leaf(node, key):
+            return False
+        self._size -= 1
+        self._modification_count += 1
+
+        # Fix underflow bottom-up: each parent rebalances the child below it
+        child = node
+        while path:
+            parent, child_index = path.pop()
+            if len(child) == 0 or child.is_underfull():
+                self._handle_underflow(parent, child_index)
+            child = parent
+
+        # Handle root collapse: if root has only one child, make that child the new root
+        root = self.root
+        if type(root) is BranchNode and len(root.children) == 1:
+            self.root = root.children[0]
+        return True
+
     def _handle_underflow(self, parent: "BranchNode", child_index: int) -> None:
         """Handle underflow in a child node by trying redistribution first"""
-        child = parent.children[child_index]
+        children = parent.children
+        child = children[child_index]
 
         # If child is not underfull, nothing to do
         if not child.is_underfull():
             return
 
-        # Handle empty children by merging them (they can't redistribute)
-        if len(child) == 0:
-            self._merge_with_sibling(parent, child_index)
-            return
-
         # Try to redistribute from siblings
         redistributed = False
 
         # Try to borrow from right sibling
-        if child_index < len(parent.children) - 1:
-            right_sibling = parent.children[child_index + 1]
+        if child_index < len(children) - 1:
+            right_sibling = children[child_index + 1]
             if right_sibling.can_donate():
                 self._redistribute_from_right(parent, child_index)
                 redistributed = True
 
         # If no redistribution from right, try left sibling
         if not redistributed and child_index > 0:
-            left_sibling = parent.children[child_index - 1]
+            left_sibling = children[child_index - 1]
             if left_sibling.can_donate():
                 self._redistribute_from_left(parent, child_index)
                 redistributed = True
@@ -324,10 +588,11 @@ class BPlusTreeMap:
 
     def _redistribute_from_left(self, parent: "BranchNode", child_index: int) -> None:
         """Redistribute keys from left sibling to child"""
-        child = parent.children[child_index]
-        left_sibling = parent.children[child_index - 1]
+        children = parent.children
+        child = children[child_index]
+        left_sibling = children[child_index - 1]
 
-        if child.is_leaf():
+        if child.IS_LEAF:
             # Leaf redistribution
             child.borrow_from_left(left_sibling)
             # Update separator key in parent
@@ -340,10 +605,11 @@ class BPlusTreeMap:
 
     def _redistribute_from_right(self, parent: "BranchNode", child_index: int) -> None:
         """Redistribute keys from right sibling to child"""
-        child = parent.children[child_index]
-        right_sibling = parent.children[child_index + 1]
+        children = parent.children
+        child = children[child_index]
+        right_sibling = children[child_index + 1]
 
-        if child.is_leaf():
+        if child.IS_LEAF:
             # Leaf redistribution
             child.borrow_from_right(right_sibling)
             # Update separator key in parent
@@ -356,108 +622,99 @@ class BPlusTreeMap:
 
     def _merge_with_sibling(self, parent: "BranchNode", child_index: int) -> None:
         """Merge an underfull child with one of its siblings"""
-        child = parent.children[child_index]
-
         # Validate parent structure before merging
-        if child_index >= len(parent.children):
+        child_count = len(parent.children)
+        if child_index >= child_count:
             raise ValueError(
-                f"Invalid child_index {child_index} for parent with {len(parent.children)} children"
+                f"Invalid child_index {child_index} for parent with {child_count} children"
             )
-        if len(parent.keys) != len(parent.children) - 1:
+        if len(parent.keys) != child_count - 1:
             raise ValueError(
-                f"Parent structure invalid: {len(parent.keys)} keys but {len(parent.children)} children"
+                f"Parent structure invalid: {len(parent.keys)} keys but {child_count} children"
             )
 
         # Prefer merging with left sibling (arbitrary choice)
         if child_index > 0:
-            # Merge with left sibling
-            left_sibling = parent.children[child_index - 1]
-
-            if child.is_leaf():
-                # Check if merging would exceed capacity
-                total_keys = len(left_sibling.keys) + len(child.keys)
-                if total_keys <= self.capacity:
-                    # Safe to merge
-                    left_sibling.merge_with_right(child)
-                    # Remove the merged child and its separator
-                    parent.children.pop(child_index)
-                    parent.keys.pop(child_index - 1)
-                else:
-                    # Cannot merge without exceeding capacity - leave nodes separate
-                    # This preserves tree structure but may leave underfull nodes
-                    pass
-            else:
-                # Check if merging would exceed capacity
-                total_keys = (
-                    len(left_sibling.keys) + len(child.keys) + 1
-                )  # +1 for separator
-                total_children = len(left_sibling.children) + len(child.children)
-                if total_keys <= self.capacity and total_children <= self.capacity + 1:
-                    # Safe to merge
-                    separator_key = parent.keys[child_index - 1]
-                    left_sibling.merge_with_right(child, separator_key)
-                    # Remove the merged child and its separator
-                    parent.children.pop(child_index)
-                    parent.keys.pop(child_index - 1)
-                else:
-                    # Cannot merge without exceeding capacity - leave nodes separate
-                    pass
-
-        elif child_index < len(parent.children) - 1:
-            # Merge with right sibling
-            right_sibling = parent.children[child_index + 1]
-
-            if child.is_leaf():
-                # Check if merging would exceed capacity
-                total_keys = len(child.keys) + len(right_sibling.keys)
-                if total_keys <= self.capacity:
-                    # Safe to merge
-                    child.merge_with_right(right_sibling)
-                    # Remove the merged sibling and its separator
-                    parent.children.pop(child_index + 1)
-                    parent.keys.pop(child_index)
-                else:
-                    # Cannot merge without exceeding capacity - leave nodes separate
-                    pass
-            else:
-                # Check if merging would exceed capacity
-                total_keys = (
-                    len(child.keys) + len(right_sibling.keys) + 1
-                )  # +1 for separator
-                total_children = len(child.children) + len(right_sibling.children)
-                if total_keys <= self.capacity and total_children <= self.capacity + 1:
-                    # Safe to merge
-                    separator_key = parent.keys[child_index]
-                    child.merge_with_right(right_sibling, separator_key)
-                    # Remove the merged sibling and its separator
-                    parent.children.pop(child_index + 1)
-                    parent.keys.pop(child_index)
-                else:
-                    # Cannot merge without exceeding capacity - leave nodes separate
-                    pass
+            self._try_merge(parent, child_index - 1, child_index)
+        elif child_index < child_count - 1:
+            self._try_merge(parent, child_index, child_index + 1)
+        # Otherwise the parent has only one child left. _delete() then
+        # rebalances the parent one level up, or collapses it if it is the root
+
+    def _try_merge(
+        self, parent: "BranchNode", left_index: int, right_index: int
+    ) -> bool:
+        """Merge parent.children[right_index] into its left neighbour.
+
+        Nodes are left separate (possibly underfull) when the merged node would
+        exceed capacity.
+
+        Returns:
+            True if the nodes were merged.
+        """
+        children = parent.children
+        left = children[left_index]
+        right = children[right_index]
+        capacity = self.capacity
+        if left.IS_LEAF:
+            if len(left.keys) + len(right.keys) > capacity:
+                return False
+            left.merge_with_right(right)
+            self._leaf_count -= 1
+            if right is self._rightmost_leaf:
+                self._rightmost_leaf = left
         else:
-            # This can happen when a parent has only one child left
-            # In this case, we should handle it by collapsing the tree structure
-            # This will be handled by the caller in _delete_recursive
-            pass
+            # +1 for the separator pulled down from the parent
+            if len(left.keys) + len(right.keys) + 1 > capacity:
+                return False
+            left.merge_with_right(right, parent.keys[left_index])
+
+        # Remove the merged node and its separator
+        children.pop(right_index)
+        parent.keys.pop(left_index)
+        return True
 
     def _delete_from_leaf(self, leaf: "LeafNode", key: Any) -> bool:
         """Delete from a leaf node. Returns True if deleted, False if not found."""
-        deleted = leaf.delete(key)
-        return deleted is not None
+        keys = leaf.keys
+        pos = bisect.bisect_left(keys, key)
+        if pos < len(keys) and keys[pos] == key:
+            del keys[pos]
+            del leaf.values[pos]
+            return True
+        return False
 
     def keys(self, start_key=None, end_key=None) -> Iterator[Any]:
         """Return an iterator over keys in the given range"""
-        for key, _ in self.items(start_key, end_key):
-            yield key
+        for keys, _ in self.items_batched(start_key, end_key):
+            yield from keys
 
     def values(self, start_key=None, end_key=None) -> Iterator[Any]:
         """Return an iterator over values in the given range"""
-        for _, value in self.items(start_key, end_key):
-            yield value
+        for _, values in self.items_batched(start_key, end_key):
+            yield from values
 
     def items(self, start_key=None, end_key=None) -> Iterator[Tuple[Any, Any]]:
         """Return an iterator over (key, value) pairs in the given range"""
+        for keys, values in self.items_batched(start_key, end_key):
+            yield from zip(keys, values)
+
+    def items_batched(
+        self, start_key=None, end_key=None
+    ) -> Iterator[Tuple[Sequence[Any], Sequence[Any]]]:
+        """Return an iterator over (keys, values) slices, one pair per leaf.
+
+        The range is the same as ``items()``: ``start_key`` inclusive,
+        ``end_key`` exclusive. Only the first and last leaf of the range are
+        searched; every leaf in between is copied out whole.
+
+        Args:
+            start_key: First key to include, or None to start at the beginning.
+            end_key: Key to stop before, or None to run to the end.
+
+        Yields:
+            ``(keys, values)`` slices of a leaf's sequences, in key order.
+        """
         if start_key is None:
             current = self.leaves
             start_index = 0
@@ -468,30 +725,34 @@ class BPlusTreeMap:
             start_index = self._find_position_in_leaf(current, start_key)
 
         while current is not None:
-            for i in range(start_index, len(current.keys)):
-                key = current.keys[i]
-                if end_key is not None and key >= end_key:
+            keys = current.keys
+            if end_key is not None and keys and not keys[-1] < end_key:
+                # Last leaf of the range: cut it at end_key and stop. A range
+                # ending at a leaf boundary stops here without searching it
+                if not keys[0] < end_key:
                     return
-                yield (key, current.values[i])
+                stop = bisect.bisect_left(keys, end_key)
+                if stop > start_index:
+                    yield keys[start_index:stop], current.values[start_index:stop]
+                return
+
+            if start_index < len(keys):
+                yield keys[start_index:], current.values[start_index:]
 
             current = current.next
             start_index = 0
 
     def _find_leaf_for_key(self, key: Any) -> Optional["LeafNode"]:
         """Find the leaf node that contains or would contain the given key"""
-        return self.root.find_leaf_for_key(key)
+        node = self.root
+        bisect_right = bisect.bisect_right
+        while type(node) is BranchNode:
+            node = node.children[bisect_right(node.keys, key)]
+        return node
 
     def _find_position_in_leaf(self, leaf: "LeafNode", key: Any) -> int:
         """Find the position where key is or would be in the leaf"""
-        # Binary search for the position
-        left, right = 0, len(leaf.keys)
-        while left < right:
-            mid = (left + right) // 2
-            if key <= leaf.keys[mid]:
-                right = mid
-            else:
-                left = mid + 1
-        return left
+        return bisect.bisect_left(leaf.keys, key)
 
     def range(
         self, start_key: Any = None, end_key: Any = None
@@ -511,13 +772,75 @@ class BPlusTreeMap:
         """
         return self.items(start_key, end_key)
 
+    def range_update(
+        self, start_key: Any, end_key: Any, func: Callable[[Any], Any]
+    ) -> int:
+        """Replace each value in a key range with ``func(value)``.
+
+        The leaves of the range are walked once along their ``next`` links and
+        each value slot is overwritten in place. Keys are untouched, so no
+        descent or rebalancing is needed per key, unlike assigning through
+        ``tree[key] = ...`` while iterating.
+
+        Args:
+            start_key: Start of range (inclusive). Use None for beginning.
+            end_key: End of range (exclusive). Use None for end.
+            func: Called with each old value; its result is stored instead.
+
+        Returns:
+            The number of values replaced.
+
+        Raises:
+            RuntimeError: If ``func``, or the release of a replaced value,
+                inserts or deletes keys in the tree.
+
+        Example:
+            tree.range_update(5, 10, lambda v: v * 2)  # Keys 5-9
+        """
+        if start_key is None:
+            current = self.leaves
+            index = 0
+        else:
+            current = self._find_leaf_for_key(start_key)
+            index = bisect.bisect_left(current.keys, start_key)
+
+        modification_count = self._modification_count
+        count = 0
+        while current is not None:
+            keys = current.keys
+            stop = len(keys)
+            last = end_key is not None and stop and not keys[-1] < end_key
+            if last:
+                stop = bisect.bisect_left(keys, end_key)
+
+            values = current.values
+            for i in range(index, stop):
+                value = func(values[i])
+                if self._modification_count != modification_count:
+                    raise RuntimeError("tree changed size during range_update")
+                values[i] = value
+                # The old value's destructor may change the tree too
+                if self._modification_count != modification_count:
+                    raise RuntimeError("tree changed size during range_update")
+            if stop > index:
+                count += stop - index
+
+            if last:
+                break
+            current = current.next
+            index = 0
+        return count
+
     def clear(self) -> None:
         """Remove all items from the tree (dict-like API)."""
         # Reset to initial state with a single empty leaf
-        original = LeafNode(self.capacity)
+        original = LeafNode(self.capacity, self.key_typecode, self.value_typecode)
         self.leaves = original
         self.root = original
-        self._rightmost_leaf_cache = None
+        self._rightmost_leaf = original
+        self._leaf_count = 1
+        self._size = 0
+        self._modification_count += 1
 
     def pop(self, key: Any, *args) -> Any:
         """Remove and return value for key with optional default (dict-like API).
@@ -585,21 +908,80 @@ class BPlusTreeMap:
     def update(self, other) -> None:
         """Update tree with key-value pairs from other mapping or iterable (dict-like API).
 
+        Batches of at least ``capacity`` items are sorted by key and inserted
+        in a single left-to-right sweep over the leaves, so consecutive keys
+        that land in the same leaf skip the descent from the root.
+
         Args:
             other: A mapping (dict-like) or iterable of (key, value) pairs.
         """
         if hasattr(other, "items"):
             # other is a mapping (dict-like)
-            for key, value in other.items():
-                self[key] = value
+            items = list(other.items())
         elif hasattr(other, "keys"):
             # other has keys method but no items (like dict.keys())
-            for key in other.keys():
-                self[key] = other[key]
+            items = [(key, other[key]) for key in other.keys()]
         else:
             # other is an iterable of (key, value) pairs
-            for key, value in other:
+            items = list(other)
+
+        if len(items) < self.capacity:
+            for key, value in items:
                 self[key] = value
+            return
+
+        # Stable sort: a key repeated in the batch keeps its last value
+        items.sort(key=itemgetter(0))
+        self._insert_sorted_batch(items)
+
+    def _leaf_for_sorted_key(self, leaf: Optional["LeafNode"], key: Any) -> "LeafNode":
+        """Return the leaf for ``key`` given the cursor leaf of the previous key.
+
+        Batch operations walk keys in ascending order. The cursor is reused
+        while ``key`` provably belongs to it (or to its right neighbour);
+        otherwise, or when ``leaf`` is None, the leaf is found by descending
+        from the root.
+        """
+        if leaf is not None:
+            next_leaf = leaf.next
+            if next_leaf is None or key <= leaf.keys[-1]:
+                return leaf
+            # Past this leaf: it either belongs to the next leaf or falls in
+            # the gap around a separator we can't see from here
+            if key >= next_leaf.keys[0] and (
+                next_leaf.next is None or key <= next_leaf.keys[-1]
+            ):
+                return next_leaf
+
+        node = self.root
+        bisect_right = bisect.bisect_right
+        while type(node) is BranchNode:
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def _insert_sorted_batch(self, items) -> None:
+        """Insert key-sorted (key, value) pairs with a leaf cursor.
+
+        Inserts that would split a leaf go through __setitem__ and drop the
+        cursor.
+        """
+        leaf = None
+        bisect_left = bisect.bisect_left
+        for key, value in items:
+            leaf = self._leaf_for_sorted_key(leaf, key)
+            # One search per key: its position feeds both the update and the
+            # insert, and fullness is checked inline
+            keys = leaf.keys
+            pos = bisect_left(keys, key)
+            if pos < len(keys) and keys[pos] == key:
+                leaf.values[pos] = value
+            elif len(keys) < leaf.capacity:
+                leaf.insert_at(pos, key, value)
+                self._size += 1
+                self._modification_count += 1
+            else:
+                self[key] = value
+                leaf = None
 
     def copy(self) -> "BPlusTreeMap":
         """Create a shallow copy of the tree (dict-like API).
@@ -607,27 +989,25 @@ class BPlusTreeMap:
         Returns:
             A new BPlusTreeMap with the same key-value pairs.
         """
-        new_tree = BPlusTreeMap(capacity=self.capacity)
-        for key, value in self.items():
-            new_tree[key] = value
-        return new_tree
+        # The items come out strictly ascending, so the copy is bulk loaded
+        return BPlusTreeMap.from_sorted_items(
+            list(self.items()),
+            capacity=self.capacity,
+            key_typecode=self.key_typecode,
+            value_typecode=self.value_typecode,
+        )
 
     """Testing only"""
 
     def leaf_count(self) -> int:
-        """Return the number of leaf nodes"""
-        count = 0
-        node = self.leaves
-        while node is not None:
-            count += 1
-            node = node.next
-        return count
+        """Return the number of leaf nodes (maintained on split and merge)"""
+        return self._leaf_count
 
     def _count_total_nodes(self) -> int:
         """Count total nodes in the tree (for testing/debugging)"""
 
         def count_nodes(node: "Node") -> int:
-            if node.is_leaf():
+            if node.IS_LEAF:
                 return 1
             total = 1
             for child in node.children:
@@ -643,8 +1023,16 @@ class Node(ABC):
     This class defines the interface that both leaf and branch nodes must implement.
     All nodes in the B+ tree have a capacity limit and can check if they are full
     or underfull (for maintaining tree invariants during deletions).
+
+    Subclasses set the ``IS_LEAF`` class attribute; hot paths read it directly
+    instead of calling ``is_leaf()``. Nodes declare ``__slots__``, so there is
+    no per-node ``__dict__`` and attribute access uses slot descriptors.
     """
 
+    __slots__ = ()
+
+    IS_LEAF: bool
+
     @abstractmethod
     def is_leaf(self) -> bool:
         """Returns True if this is a leaf node"""
@@ -670,19 +1058,41 @@ class LeafNode(Node):
     """Leaf node containing key-value pairs.
 
     Leaf nodes are where all actual key-value pairs are stored in a B+ tree.
-    They are linked together to form a doubly-linked list for efficient range queries.
+    They are linked together through ``next`` to form a singly-linked list for
+    efficient range queries. No ``prev`` pointer is kept: every structural
+    change reaches a leaf's left neighbour through the parent branch, and a
+    back pointer would turn each leaf pair into a reference cycle that only
+    the cyclic GC can free.
 
     Attributes:
         capacity: Maximum number of keys this node can hold.
-        keys: Sorted list of keys.
-        values: List of values corresponding to keys.
+        min_keys: Fewest keys a non-root leaf may hold.
+        keys: Sorted list of keys (an ``array.array`` for typed-key trees).
+        values: List of values corresponding to keys (an ``array.array`` for
+            typed-value trees).
         next: Pointer to the next leaf node (for range queries).
     """
 
-    def __init__(self, capacity: int):
+    __slots__ = ("capacity", "min_keys", "keys", "values", "next")
+
+    IS_LEAF = True
+
+    def __init__(
+        self,
+        capacity: int,
+        key_typecode: Optional[str] = None,
+        value_typecode: Optional[str] = None,
+    ):
         self.capacity = capacity
-        self.keys: List[Any] = []
-        self.values: List[Any] = []
+        # Precomputed for is_underfull()/can_donate() on the delete path
+        self.min_keys = (capacity - 1) // 2
+        # Typed keys keep the same sequence API; split/merge slices preserve it
+        self.keys: Union[List[Any], array] = (
+            [] if key_typecode is None else array(key_typecode)
+        )
+        self.values: Union[List[Any], array] = (
+            [] if value_typecode is None else array(value_typecode)
+        )
         self.next: Optional["LeafNode"] = None  # Link to next leaf
 
     def is_leaf(self) -> bool:
@@ -696,33 +1106,42 @@ class LeafNode(Node):
 
     def is_underfull(self) -> bool:
         """Check if leaf has fewer than minimum required keys."""
-        min_keys = (self.capacity - 1) // 2
-        return len(self.keys) < min_keys
+        return len(self.keys) < self.min_keys
 
     def can_donate(self) -> bool:
         """Check if leaf can give a key to a sibling (has more than minimum)."""
-        min_keys = (self.capacity - 1) // 2
-        return len(self.keys) > min_keys
+        return len(self.keys) > self.min_keys
 
     def borrow_from_left(self, left_sibling: "LeafNode") -> None:
-        """Borrow the rightmost key-value from left sibling"""
+        """Borrow the rightmost key-values from left sibling.
+
+        Moves enough entries to even out the two leaves in one slice
+        assignment, so the shift of this leaf's lists happens once per
+        underflow rather than once per borrowed entry.
+        """
         if not left_sibling.can_donate():
             raise ValueError("Left sibling cannot donate")
 
-        key = left_sibling.keys.pop()
-        value = left_sibling.values.pop()
-        self.keys.insert(0, key)
-        self.values.insert(0, value)
+        count = max(1, (len(left_sibling.keys) - len(self.keys)) // 2)
+        self.keys[0:0] = left_sibling.keys[-count:]
+        self.values[0:0] = left_sibling.values[-count:]
+        del left_sibling.keys[-count:]
+        del left_sibling.values[-count:]
 
     def borrow_from_right(self, right_sibling: "LeafNode") -> None:
-        """Borrow the leftmost key-value from right sibling"""
+        """Borrow the leftmost key-values from right sibling.
+
+        Moves enough entries to even out the two leaves in one slice
+        operation (see ``borrow_from_left``).
+        """
         if not right_sibling.can_donate():
             raise ValueError("Right sibling cannot donate")
 
-        key = right_sibling.keys.pop(0)
-        value = right_sibling.values.pop(0)
-        self.keys.append(key)
-        self.values.append(value)
+        count = max(1, (len(right_sibling.keys) - len(self.keys)) // 2)
+        self.keys.extend(right_sibling.keys[:count])
+        self.values.extend(right_sibling.values[:count])
+        del right_sibling.keys[:count]
+        del right_sibling.values[:count]
 
     def merge_with_right(self, right_sibling: "LeafNode") -> None:
         """Merge this leaf with its right sibling"""
@@ -739,9 +1158,9 @@ class LeafNode(Node):
         Returns (position, exists) where exists is True if key already exists.
         """
         # Use optimized bisect module for binary search
-        pos = bisect.bisect_left(self.keys, key)
-        exists = pos < len(self.keys) and self.keys[pos] == key
-        return pos, exists
+        keys = self.keys
+        pos = bisect.bisect_left(keys, key)
+        return pos, pos < len(keys) and keys[pos] == key
 
     def insert(self, key: Any, value: Any) -> Optional[Any]:
         """
@@ -756,29 +1175,53 @@ class LeafNode(Node):
             return old_value
         else:
             # Insert new key-value pair
-            self.keys.insert(pos, key)
-            self.values.insert(pos, value)
+            self.insert_at(pos, key, value)
             return None
 
+    def insert_at(self, pos: int, key: Any, value: Any) -> None:
+        """Insert a new key-value pair at a position already found by bisect."""
+        self.keys.insert(pos, key)
+        try:
+            self.values.insert(pos, value)
+        except (TypeError, OverflowError):
+            # A typed values array rejected the value; keep keys in step
+            del self.keys[pos]
+            raise
+
+    def append(self, key: Any, value: Any) -> None:
+        """Append a key-value pair known to sort after every key in the leaf."""
+        self.keys.append(key)
+        try:
+            self.values.append(value)
+        except (TypeError, OverflowError):
+            self.keys.pop()
+            raise
+
     def get(self, key: Any) -> Optional[Any]:
         """Get value for a key, returns None if not found"""
-        pos, exists = self.find_position(key)
-        if exists:
+        keys = self.keys
+        pos = bisect.bisect_left(keys, key)
+        if pos < len(keys) and keys[pos] == key:
             return self.values[pos]
         return None
 
     def delete(self, key: Any) -> Optional[Any]:
         """Delete a key, returns the value if found"""
-        pos, exists = self.find_position(key)
-        if exists:
-            self.keys.pop(pos)
+        keys = self.keys
+        pos = bisect.bisect_left(keys, key)
+        if pos < len(keys) and keys[pos] == key:
+            del keys[pos]
             return self.values.pop(pos)
         return None
 
-    def split(self) -> "LeafNode":
-        """Split this leaf node, returning the new right node"""
-        # Find the midpoint
-        mid = len(self.keys) // 2
+    def split(self, mid: Optional[int] = None) -> "LeafNode":
+        """Split this leaf node, returning the new right node.
+
+        Args:
+            mid: Number of entries to keep in this leaf (default: half).
+        """
+        if mid is None:
+            mid = len(self.keys) // 2
 
         # Create new leaf for right half
         new_leaf = LeafNode(self.capacity)
@@ -787,9 +1230,10 @@ class LeafNode(Node):
         new_leaf.keys = self.keys[mid:]
         new_leaf.values = self.values[mid:]
 
-        # Keep left half in this leaf
-        self.keys = self.keys[:mid]
-        self.values = self.values[:mid]
+        # Keep left half in this leaf, truncating in place so the leaf keeps
+        # its already-grown buffers instead of copying into fresh lists
+        del self.keys[mid:]
+        del self.values[mid:]
 
         # Update linked list pointers
         new_leaf.next = self.next
@@ -799,15 +1243,29 @@ class LeafNode(Node):
 
     def split_and_insert(self, key: Any, value: Any) -> Tuple["LeafNode", Any]:
         """Split leaf and insert key-value, returning (new_leaf, separator_key)"""
-        new_leaf = self.split()
-
-        # Insert into appropriate leaf
-        if key < new_leaf.keys[0]:
-            self.insert(key, value)
+        # Appending past the end of the rightmost leaf is the sequential-insert
+        # pattern: keep the left leaf as full as the occupancy invariant allows
+        # so ascending loads don't leave a trail of half-empty leaves
+        appending = self.next is None and self.keys[-1] < key
+
+        # Insert before splitting so a rejected typed key/value leaves the
+        # tree untouched instead of half-split
+        self.insert(key, value)
+        if appending:
+            new_leaf = self.split(len(self.keys) - (self.capacity - 1) // 2)
         else:
-            new_leaf.insert(key, value)
+            new_leaf = self.split()
+
+        # Separators are only compared, never mutated, so string separators
+        # are interned and shared with the leaf: repeated splits around the
+        # same key then hold one object and equal compares hit the identity
+        # fast path
+        separator = new_leaf.keys[0]
+        if type(separator) is str:
+            separator = sys.intern(separator)
+            new_leaf.keys[0] = separator
 
-        return new_leaf, new_leaf.keys[0]
+        return new_leaf, separator
 
     def find_leaf_for_key(self, _key: Any) -> "LeafNode":
         """Find the leaf node that contains or would contain the given key"""
@@ -815,7 +1273,13 @@ class LeafNode(Node):
 
     def key_count(self) -> int:
         """Count all keys in this leaf and all following leaves"""
-        return len(self) + (0 if self.next is None else self.next.key_count())
+        # Walk the chain iteratively; recursion overflows on long leaf lists
+        count = 0
+        node = self
+        while node is not None:
+            count += len(node.keys)
+            node = node.next
+        return count
 
 
 class BranchNode(Node):
@@ -826,7 +1290,8 @@ class BranchNode(Node):
 
     Attributes:
         capacity: Maximum number of keys this node can hold.
-        keys: Sorted list of separator keys.
+        min_keys: Fewest keys a non-root branch may hold.
+        keys: Sorted list (or typed ``array``) of separator keys.
         children: List of child nodes (leaves or other branches).
 
     Invariants:
@@ -835,9 +1300,16 @@ class BranchNode(Node):
         - All keys in children[i+1] >= keys[i]
     """
 
-    def __init__(self, capacity: int):
+    __slots__ = ("capacity", "min_keys", "keys", "children")
+
+    IS_LEAF = False
+
+    def __init__(self, capacity: int, key_typecode: Optional[str] = None):
         self.capacity = capacity
-        self.keys: List[Any] = []
+        self.min_keys = (capacity - 1) // 2
+        self.keys: Union[List[Any], array] = (
+            [] if key_typecode is None else array(key_typecode)
+        )
         self.children: List[Node] = []
 
     def is_leaf(self) -> bool:
@@ -851,43 +1323,55 @@ class BranchNode(Node):
 
     def is_underfull(self) -> bool:
         """Check if branch has fewer than minimum required keys"""
-        min_keys = (self.capacity - 1) // 2
-        return len(self.keys) < min_keys
+        return len(self.keys) < self.min_keys
 
     def can_donate(self) -> bool:
         """Check if branch can give a key to a sibling (has more than minimum)"""
-        min_keys = (self.capacity - 1) // 2
-        return len(self.keys) > min_keys
+        return len(self.keys) > self.min_keys
 
     def borrow_from_left(self, left_sibling: "BranchNode", separator_key: Any) -> Any:
-        """Borrow the rightmost key and child from left sibling, returns new separator"""
+        """Borrow the rightmost keys and children from left sibling, returns new separator
+
+        Moves enough children to even out the two branches in one slice
+        assignment per list.
+        """
         if not left_sibling.can_donate():
             raise ValueError("Left sibling cannot donate")
 
-        # Take the separator key as our leftmost key
-        self.keys.insert(0, separator_key)
-
-        # Take the rightmost child from left sibling
-        child = left_sibling.children.pop()
-        self.children.insert(0, child)
+        count = max(1, (len(left_sibling.keys) - len(self.keys)) // 2)
+        split = len(left_sibling.keys) - count
 
-        # The rightmost key from left sibling becomes the new separator
-        return left_sibling.keys.pop()
+        # The old separator drops between the moved keys and our own keys;
+        # the left sibling's key at the cut point becomes the new separator
+        new_separator = left_sibling.keys[split]
+        moved_keys = left_sibling.keys[split + 1 :]
+        moved_keys.append(separator_key)
+        self.keys[0:0] = moved_keys
+        self.children[0:0] = left_sibling.children[split + 1 :]
+        del left_sibling.keys[split:]
+        del left_sibling.children[split + 1 :]
+        return new_separator
 
     def borrow_from_right(self, right_sibling: "BranchNode", separator_key: Any) -> Any:
-        """Borrow the leftmost key and child from right sibling, returns new separator"""
+        """Borrow the leftmost keys and children from right sibling, returns new separator
+
+        Moves enough children to even out the two branches in one slice
+        operation per list.
+        """
         if not right_sibling.can_donate():
             raise ValueError("Right sibling cannot donate")
 
-        # Take the separator key as our rightmost key
-        self.keys.append(separator_key)
-
-        # Take the leftmost child from right sibling
-        child = right_sibling.children.pop(0)
-        self.children.append(child)
+        count = max(1, (len(right_sibling.keys) - len(self.keys)) // 2)
 
-        # The leftmost key from right sibling becomes the new separator
-        return right_sibling.keys.pop(0)
+        # The old separator drops after our own keys; the right sibling's key
+        # at the cut point becomes the new separator
+        new_separator = right_sibling.keys[count - 1]
+        self.keys.append(separator_key)
+        self.keys.extend(right_sibling.keys[: count - 1])
+        self.children.extend(right_sibling.children[:count])
+        del right_sibling.keys[:count]
+        del right_sibling.children[:count]
+        return new_separator
 
     def merge_with_right(self, right_sibling: "BranchNode", separator_key: Any) -> None:
         """Merge this branch with its right sibling using the separator key"""
@@ -899,7 +1383,12 @@ class BranchNode(Node):
         self.children.extend(right_sibling.children)
 
     def find_child_index(self, key: Any) -> int:
-        """Find which child a key should go to"""
+        """Find which child a key should go to.
+
+        This validating form is for external callers; the tree's own descents
+        bisect ``keys`` inline and rely on insert/delete keeping branches
+        well-formed.
+        """
         # Validate node structure
         if len(self.children) == 0:
             raise ValueError("BranchNode has no children")
@@ -911,26 +1400,14 @@ class BranchNode(Node):
         # Use optimized bisect module for binary search
         # bisect_right returns the insertion point for key in keys
         # For B+ trees: if key <= separator, go left; if key > separator, go right
-        index = bisect.bisect_right(self.keys, key)
-
-        # Validate result
-        if index >= len(self.children):
-            raise ValueError(
-                f"Child index {index} out of range (have {len(self.children)} children)"
-            )
-
-        return index
+        # With len(keys) == len(children) - 1 checked above, the result is
+        # always a valid child index
+        return bisect.bisect_right(self.keys, key)
 
     def get_child(self, key: Any) -> Node:
         """Get the child node where a key would be found"""
-        if not self.children:
-            raise ValueError("BranchNode has no children - tree structure corrupted")
-        index = self.find_child_index(key)
-        if index >= len(self.children):
-            raise ValueError(
-                f"Child index {index} out of range (have {len(self.children)} children)"
-            )
-        return self.children[index]
+        # find_child_index() already validates the node structure
+        return self.children[self.find_child_index(key)]
 
     def split(self) -> "BranchNode":
         """Split this branch node, returning the new right node"""
@@ -949,17 +1426,21 @@ class BranchNode(Node):
         # Move corresponding children to new branch
         new_branch.children = self.children[mid + 1 :]
 
-        # Keep left half in this branch
-        self.keys = self.keys[:mid]
-        self.children = self.children[: mid + 1]
+        # Keep left half in this branch (truncate in place, as for leaves)
+        del self.keys[mid:]
+        del self.children[mid + 1 :]
 
         return new_branch, separator_key
 
     def insert_child_and_split_if_needed(
         self, child_index: int, separator_key: Any, new_child: "Node"
     ) -> Optional[Tuple["BranchNode", Any]]:
-        """Insert separator and child, split if necessary. Returns None or (new_branch, promoted_key)"""
-        # Insert the separator key and new child at the appropriate position
+        """Insert separator and child, split if necessary. Returns None or (new_branch, promoted_key)
+
+        ``child_index`` must be the index of the child that split, as found
+        during the descent; it is used as-is and the keys are not searched
+        again. The separator goes right after that child's slot.
+        """
         self.keys.insert(child_index, separator_key)
         self.children.insert(child_index + 1, new_child)
 
@@ -972,5 +1453,9 @@ class BranchNode(Node):
 
     def find_leaf_for_key(self, key: Any) -> "LeafNode":
         """Find the leaf node that contains or would contain the given key"""
-        child = self.get_child(key)
-        return child.find_leaf_for_key(key)
+        # Descend iteratively: no frame or method dispatch per level
+        node = self
+        bisect_right = bisect.bisect_right
+        while type(node) is BranchNode:
+            node = node.children[bisect_right(node.keys, key)]
+        return node
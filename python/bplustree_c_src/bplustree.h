@@ -124,6 +124,7 @@ void node_destroy(BPlusNode *node);
 
 /* Node operations */
 int node_find_position(BPlusNode *node, PyObject *key);
+int node_find_child(BPlusNode *node, PyObject *key);
 int node_insert_leaf(BPlusNode *node, PyObject *key, PyObject *value, 
                      BPlusNode **new_node, PyObject **split_key);
 int node_insert_branch(BPlusNode *node, PyObject *key, BPlusNode *right_child,
@@ -134,8 +135,12 @@ PyObject* node_get(BPlusNode *node, PyObject *key);
 /* Tree operations */
 int tree_insert(BPlusTree *tree, PyObject *key, PyObject *value);
 int tree_delete(BPlusTree *tree, PyObject *key);
+Py_ssize_t tree_delete_sorted(BPlusTree *tree, PyObject **keys, Py_ssize_t n,
+                              int check_order);
 PyObject* tree_get(BPlusTree *tree, PyObject *key);
 BPlusNode* tree_find_leaf(BPlusTree *tree, PyObject *key);
+int tree_bulk_load(BPlusTree *tree, PyObject **keys, PyObject **values,
+                   Py_ssize_t n, double fill_factor);
 
 /* Memory pool operations (removed) */
 
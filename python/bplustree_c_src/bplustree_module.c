@@ -21,7 +21,9 @@ static int BPlusTree_clear(BPlusTree *self);
 
 PyObject *
 BPlusTree_new(PyTypeObject *type, PyObject *args, PyObject *kwds) {
-    BPlusTree *self = PyObject_GC_New(BPlusTree, type);
+    /* tp_alloc sizes the object for subclasses (the Python wrapper adds a
+     * __dict__) and starts GC tracking */
+    BPlusTree *self = (BPlusTree *)type->tp_alloc(type, 0);
     if (self != NULL) {
         self->root = NULL;
         self->leaves = NULL;
@@ -29,7 +31,6 @@ BPlusTree_new(PyTypeObject *type, PyObject *args, PyObject *kwds) {
         self->min_keys = DEFAULT_CAPACITY / 2;
         self->size = 0;
         self->modification_count = 0;
-        PyObject_GC_Track(self);
     }
     return (PyObject *)self;
 }
@@ -71,7 +72,7 @@ BPlusTree_dealloc(BPlusTree *self) {
     if (self->root) {
         node_destroy(self->root);
     }
-    PyObject_GC_Del(self);
+    Py_TYPE(self)->tp_free((PyObject *)self);
 }
 
 PyObject *
@@ -126,12 +127,14 @@ typedef struct {
     BPlusNode *current_node;
     int current_index;
     int include_values;  /* 0 for keys(), 1 for items() */
+    PyObject *end_key;   /* Exclusive upper bound, or NULL for none */
     size_t modification_count;  /* Track tree modifications */
 } BPlusTreeIterator;
 
 static void
 BPlusTreeIterator_dealloc(BPlusTreeIterator *self) {
     Py_XDECREF(self->tree);
+    Py_XDECREF(self->end_key);
     Py_TYPE(self)->tp_free((PyObject *)self);
 }
 
@@ -175,6 +178,17 @@ BPlusTreeIterator_next(BPlusTreeIterator *self) {
     }
     
     PyObject *key = node_get_key(self->current_node, self->current_index);
+
+    if (self->end_key) {
+        int before_end = fast_compare_lt(key, self->end_key);
+        if (before_end < 0) return NULL;
+        if (!before_end) {
+            /* Past the range: stop without visiting any further leaf */
+            self->current_node = NULL;
+            PyErr_SetNone(PyExc_StopIteration);
+            return NULL;
+        }
+    }
     
     if (self->include_values) {
         PyObject *value = node_get_value(self->current_node, self->current_index);
@@ -229,6 +243,7 @@ BPlusTree_iter(BPlusTree *self) {
     iter->current_node = first_leaf;
     iter->current_index = 0;
     iter->include_values = 0;
+    iter->end_key = NULL;
     iter->modification_count = self->modification_count;
     
     return (PyObject *)iter;
@@ -240,38 +255,287 @@ BPlusTree_keys(BPlusTree *self, PyObject *Py_UNUSED(ignored)) {
 }
 
 static PyObject *
-BPlusTree_items(BPlusTree *self, PyObject *Py_UNUSED(args)) {
-    BPlusTreeIterator *iter = PyObject_New(BPlusTreeIterator, &BPlusTreeIteratorType);
-    if (!iter) return NULL;
-    
-    Py_INCREF(self);
-    iter->tree = self;
-    
-    /* Find the first leaf node by traversing from root */
+BPlusTree_items(BPlusTree *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"start_key", "end_key", NULL};
+    PyObject *start_key = Py_None, *end_key = Py_None;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|OO:items", kwlist,
+                                     &start_key, &end_key))
+        return NULL;
+
+    /* Only the leaf holding start_key is searched; the rest of the range is
+     * read straight off the leaf chain */
     BPlusNode *first_leaf = self->root;
-    if (first_leaf) {
+    int first_index = 0;
+    if (start_key == Py_None) {
         while (first_leaf->type == NODE_BRANCH) {
             first_leaf = node_get_child(first_leaf, 0);
-            if (!first_leaf) break;
         }
+    } else {
+        first_leaf = tree_find_leaf(self, start_key);
+        if (!first_leaf) return NULL;
+        first_index = node_find_position(first_leaf, start_key);
+        if (first_index < 0) return NULL;
     }
+
+    BPlusTreeIterator *iter = PyObject_New(BPlusTreeIterator, &BPlusTreeIteratorType);
+    if (!iter) return NULL;
     
+    Py_INCREF(self);
+    iter->tree = self;
     iter->current_node = first_leaf;
-    iter->current_index = 0;
+    iter->current_index = first_index;
     iter->include_values = 1;
+    iter->end_key = NULL;
+    if (end_key != Py_None) {
+        Py_INCREF(end_key);
+        iter->end_key = end_key;
+    }
     iter->modification_count = self->modification_count;
     
     return (PyObject *)iter;
 }
 
 
+/* Bulk load (key, value) pairs into an empty tree. Returns False, leaving the
+ * tree untouched, if the keys are not strictly ascending; the caller then
+ * inserts them one by one. fill_factor is the fraction of each node to
+ * fill, as in the pure Python from_sorted_items. */
+static PyObject *
+BPlusTree_bulk_load(BPlusTree *self, PyObject *args) {
+    PyObject *items;
+    double fill_factor = 1.0;
+
+    if (!PyArg_ParseTuple(args, "O|d:_bulk_load", &items, &fill_factor)) {
+        return NULL;
+    }
+    if (!(fill_factor > 0.0 && fill_factor <= 1.0)) {
+        PyErr_Format(PyExc_ValueError, "fill_factor must be in (0, 1], got %R",
+                     PyTuple_GET_ITEM(args, 1));
+        return NULL;
+    }
+    if (self->size != 0) {
+        PyErr_SetString(PyExc_ValueError, "bulk load requires an empty tree");
+        return NULL;
+    }
+
+    PyObject *seq = PySequence_Fast(items, "items must be iterable");
+    if (!seq) return NULL;
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(seq);
+    PyObject **pairs = PySequence_Fast_ITEMS(seq);
+    PyObject **keys = PyMem_New(PyObject*, n ? n : 1);
+    PyObject **values = PyMem_New(PyObject*, n ? n : 1);
+    PyObject *result = NULL;
+    if (!keys || !values) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    /* Keys and values are borrowed from the pairs, which seq keeps alive */
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *pair = pairs[i];
+        if (PyTuple_Check(pair) && PyTuple_GET_SIZE(pair) == 2) {
+            keys[i] = PyTuple_GET_ITEM(pair, 0);
+            values[i] = PyTuple_GET_ITEM(pair, 1);
+        } else if (PyList_Check(pair) && PyList_GET_SIZE(pair) == 2) {
+            keys[i] = PyList_GET_ITEM(pair, 0);
+            values[i] = PyList_GET_ITEM(pair, 1);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "items must be (key, value) tuples or lists");
+            goto done;
+        }
+    }
+
+    for (Py_ssize_t i = 1; i < n; i++) {
+        int ascending = fast_compare_lt(keys[i - 1], keys[i]);
+        if (ascending < 0) goto done;
+        if (!ascending) {
+            Py_INCREF(Py_False);
+            result = Py_False;
+            goto done;
+        }
+    }
+
+    if (tree_bulk_load(self, keys, values, n, fill_factor) == 0) {
+        Py_INCREF(Py_True);
+        result = Py_True;
+    }
+
+done:
+    PyMem_Free(keys);
+    PyMem_Free(values);
+    Py_DECREF(seq);
+    return result;
+}
+
+/* Delete many keys, skipping any that are not in the tree. The keys are
+ * sorted (unless the caller says they already are) so the deletes sweep the
+ * leaf chain once. Returns the number of keys deleted. */
+static PyObject *
+BPlusTree_delete_batch(BPlusTree *self, PyObject *args, PyObject *kwds) {
+    static char *kwlist[] = {"keys", "presorted", NULL};
+    PyObject *keys;
+    int presorted = 0;
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|p:delete_batch", kwlist,
+                                     &keys, &presorted))
+        return NULL;
+
+    PyObject *list = PySequence_List(keys);
+    if (!list) return NULL;
+    if (!presorted && PyList_Sort(list) < 0) {
+        Py_DECREF(list);
+        return NULL;
+    }
+
+    /* The list keeps the keys alive while the tree drops its references */
+    Py_ssize_t deleted = tree_delete_sorted(self, PySequence_Fast_ITEMS(list),
+                                            PyList_GET_SIZE(list), presorted);
+    Py_DECREF(list);
+    if (deleted < 0) return NULL;
+    return PyLong_FromSsize_t(deleted);
+}
+
+/* Replace each value with func(value) for keys in [start_key, end_key),
+ * walking the leaf chain once instead of descending per key. None leaves
+ * that end of the range open. Returns the number of values replaced. */
+static PyObject *
+BPlusTree_range_update(BPlusTree *self, PyObject *args) {
+    PyObject *start_key, *end_key, *func;
+    if (!PyArg_ParseTuple(args, "OOO:range_update", &start_key, &end_key, &func))
+        return NULL;
+    if (!PyCallable_Check(func)) {
+        PyErr_SetString(PyExc_TypeError, "func must be callable");
+        return NULL;
+    }
+
+    BPlusNode *leaf;
+    int index = 0;
+    if (start_key == Py_None) {
+        leaf = self->root;
+        while (leaf->type == NODE_BRANCH) {
+            leaf = node_get_child(leaf, 0);
+        }
+    } else {
+        leaf = tree_find_leaf(self, start_key);
+        if (!leaf) return NULL;
+        index = node_find_position(leaf, start_key);
+        if (index < 0) return NULL;
+    }
+
+    size_t modification_count = self->modification_count;
+    Py_ssize_t count = 0;
+    while (leaf) {
+        int stop = leaf->num_keys;
+        int last = 0;
+        if (end_key != Py_None && stop > 0) {
+            int before_end = fast_compare_lt(node_get_key(leaf, stop - 1), end_key);
+            if (before_end < 0) return NULL;
+            if (!before_end) {
+                /* Last leaf of the range: cut it at end_key */
+                stop = node_find_position(leaf, end_key);
+                if (stop < 0) return NULL;
+                last = 1;
+            }
+        }
+
+        for (; index < stop; index++) {
+            PyObject *old_value = node_get_value(leaf, index);
+            Py_INCREF(old_value);
+            PyObject *new_value = PyObject_CallFunctionObjArgs(func, old_value, NULL);
+            Py_DECREF(old_value);
+            if (!new_value) return NULL;
+            if (self->modification_count != modification_count) {
+                Py_DECREF(new_value);
+                PyErr_SetString(PyExc_RuntimeError,
+                                "tree changed size during range_update");
+                return NULL;
+            }
+            /* Values never move keys, so the slot is written in place */
+            node_set_value(leaf, index, new_value);
+            /* The old value's destructor may change the tree; check before
+             * the leaf is read again */
+            Py_DECREF(old_value);
+            count++;
+            if (self->modification_count != modification_count) {
+                PyErr_SetString(PyExc_RuntimeError,
+                                "tree changed size during range_update");
+                return NULL;
+            }
+        }
+
+        if (last) break;
+        leaf = leaf->next;
+        index = 0;
+    }
+
+    return PyLong_FromSsize_t(count);
+}
+
+/* Append the key count of node and every node below it to the list for its
+ * depth in levels, adding lists as deeper levels are reached */
+static int
+collect_node_sizes(BPlusNode *node, Py_ssize_t depth, PyObject *levels) {
+    if (PyList_GET_SIZE(levels) == depth) {
+        PyObject *level = PyList_New(0);
+        if (!level) return -1;
+        int err = PyList_Append(levels, level);
+        Py_DECREF(level);
+        if (err < 0) return -1;
+    }
+
+    PyObject *size = PyLong_FromLong(node->num_keys);
+    if (!size) return -1;
+    int err = PyList_Append(PyList_GET_ITEM(levels, depth), size);
+    Py_DECREF(size);
+    if (err < 0) return -1;
+
+    if (node->type == NODE_BRANCH) {
+        for (int i = 0; i <= node->num_keys; i++) {
+            if (collect_node_sizes(node_get_child(node, i), depth + 1,
+                                   levels) < 0) {
+                return -1;
+            }
+        }
+    }
+    return 0;
+}
+
+static PyObject *
+BPlusTree_node_sizes(BPlusTree *self, PyObject *Py_UNUSED(ignored)) {
+    PyObject *levels = PyList_New(0);
+    if (!levels) return NULL;
+    if (collect_node_sizes(self->root, 0, levels) < 0) {
+        Py_DECREF(levels);
+        return NULL;
+    }
+    return levels;
+}
+
 /* Method definitions */
 
 static PyMethodDef BPlusTree_methods[] = {
     {"keys", (PyCFunction)BPlusTree_keys, METH_NOARGS,
      "Return an iterator over the tree's keys"},
-    {"items", (PyCFunction)BPlusTree_items, METH_VARARGS,
-     "Return an iterator over the tree's (key, value) pairs"},
+    {"items", (PyCFunction)(void(*)(void))BPlusTree_items,
+     METH_VARARGS | METH_KEYWORDS,
+     "items(start_key=None, end_key=None)\n"
+     "Return an iterator over the tree's (key, value) pairs, optionally\n"
+     "limited to start_key <= key < end_key"},
+    {"_bulk_load", (PyCFunction)BPlusTree_bulk_load, METH_VARARGS,
+     "_bulk_load(items, fill_factor=1.0)\n"
+     "Bulk load sorted (key, value) pairs into an empty tree; "
+     "return False if the keys are not strictly ascending"},
+    {"delete_batch", (PyCFunction)(void(*)(void))BPlusTree_delete_batch,
+     METH_VARARGS | METH_KEYWORDS,
+     "delete_batch(keys, presorted=False)\n"
+     "Delete many keys, skipping missing ones; return the number deleted"},
+    {"range_update", (PyCFunction)BPlusTree_range_update, METH_VARARGS,
+     "Replace each value in [start_key, end_key) with func(value); "
+     "return the number of values replaced"},
+    {"_node_sizes", (PyCFunction)BPlusTree_node_sizes, METH_NOARGS,
+     "Return the key count of every node, as one list per level from the "
+     "root down (for tests)"},
     {NULL, NULL, 0, NULL}  /* Sentinel */
 };
 
@@ -88,6 +88,36 @@ int node_find_position(BPlusNode *node, PyObject *key) {
     return left;
 }
 
+/*
+ * Binary search for the child of a branch node that covers key.
+ *
+ * Upper-bound search (bisect_right): returns the number of separators that
+ * are <= key. Searching for the upper bound directly saves the extra
+ * equality comparison a lower-bound search needs to step past a separator
+ * equal to key, which is one rich comparison per level on every descent.
+ */
+int node_find_child(BPlusNode *node, PyObject *key) {
+    int left = 0;
+    int right = node->num_keys;
+
+    while (left < right) {
+        int mid = (left + right) / 2;
+
+        int result = fast_compare_lt(key, node_get_key(node, mid));
+        if (result < 0) {
+            return -1;  /* Error in comparison */
+        }
+
+        if (result) {
+            right = mid;
+        } else {
+            left = mid + 1;
+        }
+    }
+
+    return left;
+}
+
 /* Create a new node */
 BPlusNode* node_create(NodeType type, uint16_t capacity) {
     size_t data_size;
@@ -144,28 +174,20 @@ void node_destroy(BPlusNode *node) {
     cache_aligned_free(node);
 }
 
-/* Clear a single slot: decref or destroy payload and null out key/value or child pointer */
-static void node_clear_slot(BPlusNode *node, int i) {
-    if (i < 0 || i >= node->capacity) {
-        return;  /* Invalid index */
-    }
-    
-    if (node->type == NODE_LEAF) {
-        Py_XDECREF(node_get_key(node, i));
-        Py_XDECREF(node_get_value(node, i));
-        node_set_key(node, i, NULL);
-        node_set_value(node, i, NULL);
-    } else {
-        /* For branch nodes, we only clear during deletion operations
-         * where it's safe to destroy the child subtree */
-        BPlusNode *child = node_get_child(node, i);
-        if (child) {
-            node_destroy(child);
-        }
-        Py_XDECREF(node_get_key(node, i));
-        node_set_key(node, i, NULL);
-        node_set_child(node, i, NULL);
-    }
+/* Insert at a known position in a leaf with a free slot; takes new references */
+static void leaf_insert_at(BPlusNode *node, int pos, PyObject *key, PyObject *value) {
+    PyObject **keys = node->data;
+    PyObject **values = node->data + node->capacity;
+    size_t tail = (size_t)(node->num_keys - pos) * sizeof(PyObject*);
+
+    memmove(keys + pos + 1, keys + pos, tail);
+    memmove(values + pos + 1, values + pos, tail);
+
+    Py_INCREF(key);
+    Py_INCREF(value);
+    keys[pos] = key;
+    values[pos] = value;
+    node->num_keys++;
 }
 
 /* Insert into leaf node */
@@ -192,97 +214,44 @@ int node_insert_leaf(BPlusNode *node, PyObject *key, PyObject *value,
     
     /* Check if split is needed */
     if (node->num_keys >= node->capacity) {
-        /* Create new node */
-        *new_node = node_create(NODE_LEAF, node->capacity);
-        if (!*new_node) return -1;
-        
-        /* Temporary arrays for redistribution */
-        PyObject **temp_keys = PyMem_Malloc((node->capacity + 1) * sizeof(PyObject*));
-        PyObject **temp_values = PyMem_Malloc((node->capacity + 1) * sizeof(PyObject*));
-        if (!temp_keys || !temp_values) {
-            PyMem_Free(temp_keys);
-            PyMem_Free(temp_values);
-            node_destroy(*new_node);
-            PyErr_NoMemory();
-            return -1;
-        }
-        
-        /* Copy existing + new into temp arrays */
-        int j = 0;
-        for (int i = 0; i < pos; i++) {
-            temp_keys[j] = node_get_key(node, i);
-            temp_values[j] = node_get_value(node, i);
-            j++;
-        }
-        temp_keys[j] = key;
-        temp_values[j] = value;
-        j++;
-        for (int i = pos; i < node->num_keys; i++) {
-            temp_keys[j] = node_get_key(node, i);
-            temp_values[j] = node_get_value(node, i);
-            j++;
-        }
-        
-        /* Split at midpoint - exactly like Python code */
-        int mid = node->capacity / 2;  /* Same as Python: self.capacity // 2 */
+        int capacity = node->capacity;
+        int mid = capacity / 2;  /* Same as Python: self.capacity // 2 */
+        /* The left node ends with mid entries: one fewer stays behind when
+         * the new entry will land in it */
+        int goes_left = pos < mid;
+        int cut = goes_left ? mid - 1 : mid;
+        int moved = node->num_keys - cut;
+        BPlusNode *right = node_create(NODE_LEAF, capacity);
+        if (!right) return -1;
 
-        /* Keep first half in current node */
-        node->num_keys = mid;
-        for (int i = 0; i < mid; i++) {
-            Py_INCREF(temp_keys[i]);
-            Py_INCREF(temp_values[i]);
-            node_set_key(node, i, temp_keys[i]);
-            node_set_value(node, i, temp_values[i]);
-        }
+        /* Move the upper entries across; their references move with them */
+        memcpy(right->data, node->data + cut, moved * sizeof(PyObject*));
+        memcpy(right->data + capacity, node->data + capacity + cut,
+               moved * sizeof(PyObject*));
+        memset(node->data + cut, 0, moved * sizeof(PyObject*));
+        memset(node->data + capacity + cut, 0, moved * sizeof(PyObject*));
+        right->num_keys = moved;
+        node->num_keys = cut;
 
-        /* Clear old slots beyond midpoint - DO NOT DECREF as items were moved to temp arrays */
-        for (int i = mid; i < node->capacity; i++) {
-            node_set_key(node, i, NULL);
-            node_set_value(node, i, NULL);
+        if (goes_left) {
+            leaf_insert_at(node, pos, key, value);
+        } else {
+            leaf_insert_at(right, pos - cut, key, value);
         }
 
-        /* Move second half to new node */
-        int total_items = node->capacity + 1;
-        (*new_node)->num_keys = total_items - mid;
-        for (int i = 0; i < (*new_node)->num_keys; i++) {
-            Py_INCREF(temp_keys[mid + i]);
-            Py_INCREF(temp_values[mid + i]);
-            node_set_key(*new_node, i, temp_keys[mid + i]);
-            node_set_value(*new_node, i, temp_values[mid + i]);
-        }
-        
         /* Update links */
-        (*new_node)->next = node->next;
-        node->next = *new_node;
-        
-        /* Flags no longer needed after SIMD removal */
-        
-        /* Set split key */
-        *split_key = node_get_key(*new_node, 0);
+        right->next = node->next;
+        node->next = right;
+
+        /* The separator is shared with the new leaf, so it needs its own reference */
+        *new_node = right;
+        *split_key = node_get_key(right, 0);
         Py_INCREF(*split_key);
-        
-        /* Clean up temps */
-        PyMem_Free(temp_keys);
-        PyMem_Free(temp_values);
-        
+
         return 1;  /* Split occurred */
     }
     
-    /* Normal insert - shift elements right */
-    for (int i = node->num_keys; i > pos; i--) {
-        node_set_key(node, i, node_get_key(node, i - 1));
-        node_set_value(node, i, node_get_value(node, i - 1));
-    }
-    
-    /* Insert new key-value */
-    Py_INCREF(key);
-    Py_INCREF(value);
-    node_set_key(node, pos, key);
-    node_set_value(node, pos, value);
-    node->num_keys++;
-    
-    /* No flag updates needed after SIMD removal */
-    
+    leaf_insert_at(node, pos, key, value);
     return 0;  /* No split */
 }
 
@@ -305,19 +274,22 @@ int node_delete(BPlusNode *node, PyObject *key) {
     if (cmp < 0) return -1;  /* Comparison error */
     if (!cmp) return 0;      /* Key not found */
     
-    /* Clear the removed slot */
-    node_clear_slot(node, pos);
+    /* Release the removed entry, then close the gap */
+    PyObject **keys = node->data;
+    PyObject **values = node->data + node->capacity;
+    PyObject *old_key = keys[pos];
+    PyObject *old_value = values[pos];
+    size_t tail = (size_t)(node->num_keys - pos - 1) * sizeof(PyObject*);
 
-    /* Shift elements left to fill the gap */
-    for (int i = pos; i < node->num_keys - 1; i++) {
-        node_set_key(node, i, node_get_key(node, i + 1));
-        node_set_value(node, i, node_get_value(node, i + 1));
-    }
-
-    /* Clear the last slot */
+    memmove(keys + pos, keys + pos + 1, tail);
+    memmove(values + pos, values + pos + 1, tail);
     node->num_keys--;
-    node_set_key(node, node->num_keys, NULL);
-    node_set_value(node, node->num_keys, NULL);
+    keys[node->num_keys] = NULL;
+    values[node->num_keys] = NULL;
+
+    /* Decref last: a destructor may run arbitrary code */
+    Py_DECREF(old_key);
+    Py_DECREF(old_value);
 
     return 1;  /* Successfully deleted */
 }
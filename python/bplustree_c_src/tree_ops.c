@@ -12,21 +12,10 @@ BPlusNode* tree_find_leaf(BPlusTree *tree, PyObject *key) {
     BPlusNode *node = tree->root;
     
     while (node->type == NODE_BRANCH) {
-        int pos = node_find_position(node, key);
+        int pos = node_find_child(node, key);
         if (pos < 0) {
             return NULL;
         }
-        /* bisect_right semantics: advance past equal keys */
-        if (pos < node->num_keys) {
-            PyObject *node_key = node_get_key(node, pos);
-            int eq = fast_compare_eq(node_key, key);
-            if (eq < 0) {
-                return NULL;
-            }
-            if (eq) {
-                pos++;
-            }
-        }
         /* Ensure pos is within valid child range */
         if (pos > node->num_keys) {
             return NULL;
@@ -47,21 +36,10 @@ static int tree_insert_recursive(BPlusNode *node, PyObject *key, PyObject *value
     }
     
     /* Find child to insert into */
-    int child_pos = node_find_position(node, key);
+    int child_pos = node_find_child(node, key);
     if (child_pos < 0) {
         return -1;
     }
-    /* bisect_right semantics: advance past equal keys */
-    if (child_pos < node->num_keys) {
-        PyObject *node_key = node_get_key(node, child_pos);
-        int eq = fast_compare_eq(node_key, key);
-        if (eq < 0) {
-            return -1;
-        }
-        if (eq) {
-            child_pos++;
-        }
-    }
     BPlusNode *child = node_get_child(node, child_pos);
     BPlusNode *new_child = NULL;
     PyObject *new_key = NULL;
@@ -124,6 +102,54 @@ int tree_delete(BPlusTree *tree, PyObject *key) {
     return result;
 }
 
+/* Delete n keys (borrowed references) in ascending order, moving a cursor
+ * along the leaf chain instead of descending from the root for every key.
+ * With check_order set, a key smaller than its predecessor restarts from the
+ * root, so out-of-order keys are still deleted. Like tree_delete, leaves are
+ * not rebalanced. Returns the number of keys deleted, or -1 on error. */
+Py_ssize_t tree_delete_sorted(BPlusTree *tree, PyObject **keys, Py_ssize_t n,
+                              int check_order) {
+    BPlusNode *leaf = NULL;
+    Py_ssize_t deleted = 0;
+
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *key = keys[i];
+
+        if (leaf && check_order) {
+            int backwards = fast_compare_lt(key, keys[i - 1]);
+            if (backwards < 0) return -1;
+            if (backwards) leaf = NULL;
+        }
+
+        if (!leaf) {
+            leaf = tree_find_leaf(tree, key);
+            if (!leaf) return -1;
+        } else {
+            /* Step right while the key is at or past the next non-empty leaf */
+            for (BPlusNode *next = leaf->next; next; next = next->next) {
+                if (next->num_keys == 0) continue;
+                int before = fast_compare_lt(key, node_get_key(next, 0));
+                if (before < 0) return -1;
+                if (before) break;
+                leaf = next;
+            }
+        }
+
+        size_t modification_count = tree->modification_count;
+        int result = node_delete(leaf, key);
+        if (result < 0) return -1;
+        if (result) {
+            /* A destructor run by the delete may have changed the tree */
+            if (tree->modification_count != modification_count) leaf = NULL;
+            tree->size--;
+            tree->modification_count++;
+            deleted++;
+        }
+    }
+
+    return deleted;
+}
+
 /* Get value for key */
 PyObject* tree_get(BPlusTree *tree, PyObject *key) {
     BPlusNode *leaf = tree_find_leaf(tree, key);
@@ -131,7 +157,24 @@ PyObject* tree_get(BPlusTree *tree, PyObject *key) {
     return node_get(leaf, key);
 }
 
-/* Insert into branch node */
+/* Insert a separator and its right child in a branch with a free slot.
+ * The branch takes over the caller's reference to key. */
+static void branch_insert_at(BPlusNode *node, int pos, PyObject *key,
+                             BPlusNode *right_child) {
+    PyObject **keys = node->data;
+    PyObject **children = node->data + node->capacity;
+    int tail = node->num_keys - pos;
+
+    memmove(keys + pos + 1, keys + pos, tail * sizeof(PyObject*));
+    memmove(children + pos + 2, children + pos + 1, tail * sizeof(PyObject*));
+
+    keys[pos] = key;
+    children[pos + 1] = (PyObject*)right_child;
+    node->num_keys++;
+}
+
+/* Insert into branch node. key is an owned reference (the separator produced
+ * by the child's split); it ends up either in a node or in *split_key. */
 int node_insert_branch(BPlusNode *node, PyObject *key, BPlusNode *right_child,
                        BPlusNode **new_node, PyObject **split_key) {
     int pos = node_find_position(node, key);
@@ -139,82 +182,224 @@ int node_insert_branch(BPlusNode *node, PyObject *key, BPlusNode *right_child,
     
     /* Check if split is needed */
     if (node->num_keys >= node->capacity) {
-        /* Create new node */
-        *new_node = node_create(NODE_BRANCH, node->capacity);
-        if (!*new_node) return -1;
-        
-        /* Temporary arrays for redistribution */
-        PyObject **temp_keys = PyMem_Malloc((node->capacity + 1) * sizeof(PyObject*));
-        BPlusNode **temp_children = PyMem_Malloc((node->capacity + 2) * sizeof(BPlusNode*));
-        if (!temp_keys || !temp_children) {
-            PyMem_Free(temp_keys);
-            PyMem_Free(temp_children);
-            node_destroy(*new_node);
-            PyErr_NoMemory();
-            return -1;
+        int capacity = node->capacity;
+        int n = node->num_keys;
+        int mid = capacity / 2;
+        PyObject **keys = node->data;
+        PyObject **children = node->data + capacity;
+        BPlusNode *right = node_create(NODE_BRANCH, capacity);
+        if (!right) return -1;
+        PyObject **right_keys = right->data;
+        PyObject **right_children = right->data + capacity;
+
+        /* Of the capacity + 1 keys (with the new one), the one at mid is
+         * promoted. References move with the pointers, so nothing is
+         * increfed here. */
+        if (pos == mid) {
+            /* The new key itself is promoted; its child heads the right node */
+            int moved = n - mid;
+            memcpy(right_keys, keys + mid, moved * sizeof(PyObject*));
+            right_children[0] = (PyObject*)right_child;
+            memcpy(right_children + 1, children + mid + 1, moved * sizeof(PyObject*));
+            memset(keys + mid, 0, moved * sizeof(PyObject*));
+            memset(children + mid + 1, 0, moved * sizeof(PyObject*));
+            right->num_keys = moved;
+            node->num_keys = mid;
+            *split_key = key;
+        } else {
+            /* An existing key is promoted: keys[mid - 1] if the new key goes
+             * left (shifting it up), keys[mid] if it goes right */
+            int promote = pos < mid ? mid - 1 : mid;
+            int moved = n - promote - 1;
+            *split_key = keys[promote];
+            memcpy(right_keys, keys + promote + 1, moved * sizeof(PyObject*));
+            memcpy(right_children, children + promote + 1,
+                   (moved + 1) * sizeof(PyObject*));
+            memset(keys + promote, 0, (moved + 1) * sizeof(PyObject*));
+            memset(children + promote + 1, 0, (moved + 1) * sizeof(PyObject*));
+            right->num_keys = moved;
+            node->num_keys = promote;
+
+            if (pos < mid) {
+                branch_insert_at(node, pos, key, right_child);
+            } else {
+                branch_insert_at(right, pos - promote - 1, key, right_child);
+            }
         }
-        
-        /* Copy existing + new into temp arrays */
-        temp_children[0] = node_get_child(node, 0);
-        
-        int j = 0;
-        for (int i = 0; i < pos; i++) {
-            temp_keys[j] = node_get_key(node, i);
-            temp_children[j + 1] = node_get_child(node, i + 1);
-            j++;
+
+        *new_node = right;
+        return 1;  /* Split occurred */
+    }
+    
+    branch_insert_at(node, pos, key, right_child);
+    return 0;  /* No split */
+}
+
+/* Split count entries into runs of size, writing runs + 1 boundaries to
+ * starts (which must hold count / size + 2 entries). A last run shorter than
+ * min_size shares the entries of the run before it evenly instead. When size
+ * is below 2 * min_size even that can leave a short run, so all entries are
+ * then spread evenly over as many runs as min_size allows, as in the pure
+ * Python _bulk_load_ranges. Returns the number of runs. */
+static Py_ssize_t bulk_load_runs(Py_ssize_t count, Py_ssize_t size,
+                                 Py_ssize_t min_size, Py_ssize_t *starts) {
+    Py_ssize_t runs = (count + size - 1) / size;
+
+    for (Py_ssize_t i = 0; i < runs; i++) {
+        starts[i] = i * size;
+    }
+    starts[runs] = count;
+    if (runs > 1 && count - starts[runs - 1] < min_size) {
+        Py_ssize_t combined = count - starts[runs - 2];
+        if (combined / 2 >= min_size) {
+            starts[runs - 1] = starts[runs - 2] + combined - combined / 2;
+        } else {
+            Py_ssize_t base, extra;
+            if (runs > count / min_size) {
+                runs = count / min_size;
+            }
+            base = count / runs;
+            extra = count % runs;
+            for (Py_ssize_t i = 0; i < runs; i++) {
+                starts[i] = i * base + (i < extra ? i : extra);
+            }
+            starts[runs] = count;
         }
-        temp_keys[j] = key;
-        temp_children[j + 1] = right_child;
-        j++;
-        for (int i = pos; i < node->num_keys; i++) {
-            temp_keys[j] = node_get_key(node, i);
-            temp_children[j + 1] = node_get_child(node, i + 1);
-            j++;
+    }
+    return runs;
+}
+
+/* Build the tree bottom-up from n strictly ascending keys and their values
+ * (borrowed references). The tree must be empty. Each node is filled to
+ * fill_factor of its capacity, but never below its minimum occupancy. Leaves
+ * are chained, then each branch level is built over the level below, taking the
+ * smallest key of every child but the first as its separators. */
+int tree_bulk_load(BPlusTree *tree, PyObject **keys, PyObject **values,
+                   Py_ssize_t n, double fill_factor) {
+    int capacity = tree->capacity;
+    Py_ssize_t per_leaf = (Py_ssize_t)(capacity * fill_factor);
+    Py_ssize_t per_branch = (Py_ssize_t)((capacity + 1) * fill_factor);
+    Py_ssize_t count;
+    BPlusNode **level = NULL;
+    BPlusNode **parents = NULL;
+    PyObject **low_keys = NULL;
+    PyObject **parent_low_keys = NULL;
+    Py_ssize_t *starts = NULL;
+
+    if (n == 0) {
+        return 0;
+    }
+    if (per_leaf > capacity) per_leaf = capacity;
+    if (per_leaf < tree->min_keys) per_leaf = tree->min_keys;
+    if (per_leaf < 1) per_leaf = 1;
+    if (per_branch > capacity + 1) per_branch = capacity + 1;
+    if (per_branch < tree->min_keys + 1) per_branch = tree->min_keys + 1;
+
+    /* Leaf runs are the most numerous, so this covers every level */
+    starts = PyMem_New(Py_ssize_t, n / per_leaf + 2);
+    level = PyMem_New(BPlusNode*, n / per_leaf + 1);
+    low_keys = PyMem_New(PyObject*, n / per_leaf + 1);
+    if (!starts || !level || !low_keys) {
+        PyErr_NoMemory();
+        goto fail;
+    }
+
+    count = bulk_load_runs(n, per_leaf, tree->min_keys, starts);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_ssize_t start = starts[i];
+        int size = (int)(starts[i + 1] - start);
+        BPlusNode *leaf = node_create(NODE_LEAF, capacity);
+        if (!leaf) {
+            for (Py_ssize_t j = 0; j < i; j++) {
+                node_destroy(level[j]);
+            }
+            goto fail;
         }
-        
-        /* Split at midpoint */
-        int mid = node->capacity / 2;
-        *split_key = temp_keys[mid];
-        Py_INCREF(*split_key);
-        
-        /* Keep first half in current node */
-        node->num_keys = mid;
-        for (int i = 0; i < mid; i++) {
-            Py_INCREF(temp_keys[i]);
-            node_set_key(node, i, temp_keys[i]);
+
+        memcpy(leaf->data, keys + start, size * sizeof(PyObject*));
+        memcpy(leaf->data + capacity, values + start, size * sizeof(PyObject*));
+        for (int j = 0; j < size; j++) {
+            Py_INCREF(keys[start + j]);
+            Py_INCREF(values[start + j]);
         }
-        for (int i = 0; i <= mid; i++) {
-            node_set_child(node, i, temp_children[i]);
+        leaf->num_keys = size;
+        if (i > 0) {
+            level[i - 1]->next = leaf;
         }
-        
-        /* Move second half to new node */
-        (*new_node)->num_keys = node->capacity - mid;
-        for (int i = 0; i < (*new_node)->num_keys; i++) {
-            Py_INCREF(temp_keys[mid + 1 + i]);
-            node_set_key(*new_node, i, temp_keys[mid + 1 + i]);
+        level[i] = leaf;
+        low_keys[i] = keys[start];
+    }
+
+    /* A branch with k separators has k + 1 children */
+    while (count > 1) {
+        Py_ssize_t parent_count = bulk_load_runs(count, per_branch,
+                                                 tree->min_keys + 1, starts);
+        parents = PyMem_New(BPlusNode*, parent_count);
+        parent_low_keys = PyMem_New(PyObject*, parent_count);
+        if (!parents || !parent_low_keys) {
+            PyErr_NoMemory();
+            for (Py_ssize_t j = 0; j < count; j++) {
+                node_destroy(level[j]);
+            }
+            goto fail;
         }
-        for (int i = 0; i <= (*new_node)->num_keys; i++) {
-            node_set_child(*new_node, i, temp_children[mid + 1 + i]);
+
+        for (Py_ssize_t i = 0; i < parent_count; i++) {
+            Py_ssize_t start = starts[i];
+            int children = (int)(starts[i + 1] - start);
+            BPlusNode *branch = node_create(NODE_BRANCH, capacity);
+            if (!branch) {
+                /* Built branches own the children they took */
+                for (Py_ssize_t j = 0; j < i; j++) {
+                    node_destroy(parents[j]);
+                }
+                for (Py_ssize_t j = start; j < count; j++) {
+                    node_destroy(level[j]);
+                }
+                goto fail;
+            }
+
+            memcpy(branch->data + capacity, level + start,
+                   children * sizeof(PyObject*));
+            for (int j = 1; j < children; j++) {
+                PyObject *separator = low_keys[start + j];
+                Py_INCREF(separator);
+                node_set_key(branch, j - 1, separator);
+            }
+            branch->num_keys = children - 1;
+            parents[i] = branch;
+            parent_low_keys[i] = low_keys[start];
         }
-        
-        /* Clean up temps */
-        PyMem_Free(temp_keys);
-        PyMem_Free(temp_children);
-        
-        return 1;  /* Split occurred */
+
+        PyMem_Free(level);
+        PyMem_Free(low_keys);
+        level = parents;
+        low_keys = parent_low_keys;
+        parents = NULL;
+        parent_low_keys = NULL;
+        count = parent_count;
     }
-    
-    /* Normal insert - shift elements right */
-    for (int i = node->num_keys; i > pos; i--) {
-        node_set_key(node, i, node_get_key(node, i - 1));
-        node_set_child(node, i + 1, node_get_child(node, i));
+
+    /* Replace the empty initial leaf */
+    node_destroy(tree->root);
+    tree->root = level[0];
+    tree->leaves = tree->root;
+    while (tree->leaves->type == NODE_BRANCH) {
+        tree->leaves = node_get_child(tree->leaves, 0);
     }
-    
-    /* Insert new key and child */
-    Py_INCREF(key);
-    node_set_key(node, pos, key);
-    node_set_child(node, pos + 1, right_child);
-    node->num_keys++;
-    
-    return 0;  /* No split */
-}
\ No newline at end of file
+    tree->size = (size_t)n;
+    tree->modification_count++;
+
+    PyMem_Free(starts);
+    PyMem_Free(level);
+    PyMem_Free(low_keys);
+    return 0;
+
+fail:
+    PyMem_Free(starts);
+    PyMem_Free(level);
+    PyMem_Free(low_keys);
+    PyMem_Free(parents);
+    PyMem_Free(parent_low_keys);
+    return -1;
+}
@@ -1,14 +1,35 @@
 """
 Pytest configuration for building the C extension before tests.
 """
+import os
 import sys
 import subprocess
 from pathlib import Path
 
 here = Path(__file__).parent
-subprocess.check_call(
-    [sys.executable, "setup.py", "build_ext", "--inplace"], cwd=str(here)
-)
+
+
+def _extension_is_stale() -> bool:
+    """Return True if a C source or setup.py is newer than the built module."""
+    built = [
+        path.stat().st_mtime
+        for pattern in ("bplustree_c*.so", "bplustree_c*.pyd")
+        for path in here.glob(pattern)
+    ]
+    if not built:
+        return True
+    sources = [here / "setup.py"]
+    for pattern in ("*.c", "*.h"):
+        sources.extend((here / "bplustree_c_src").glob(pattern))
+    return max(path.stat().st_mtime for path in sources) > min(built)
+
+
+# setup.py only compiles the extension when BPLUSTREE_BUILD_C_EXTENSION is set,
+# so skip the subprocess unless it would actually rebuild something
+if os.environ.get("BPLUSTREE_BUILD_C_EXTENSION") and _extension_is_stale():
+    subprocess.check_call(
+        [sys.executable, "setup.py", "build_ext", "--inplace"], cwd=str(here)
+    )
 
 # Ensure the C extension built in this directory is importable
 sys.path.insert(0, str(here))
@@ -96,7 +96,9 @@ def benchmark_range_queries():
             if HAS_SORTEDDICT:
 
                 def sorted_dict_range():
-                    return list(sorted_dict.irange(start_key, end_key - 1))
+                    start = sorted_dict.bisect_left(start_key)
+                    stop = sorted_dict.bisect_left(end_key)
+                    return sorted_dict.items()[start:stop]
 
                 sorted_time, sorted_result = benchmark_function(sorted_dict_range)
                 print(
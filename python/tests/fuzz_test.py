@@ -2,13 +2,13 @@
 Comprehensive fuzz tester for B+ Tree implementation.
 
 This tester performs a million random operations and compares results with
-a reference implementation (OrderedDict), while tracking operations for
+a reference implementation (a plain dict), while tracking operations for
 debugging purposes.
 """
 
+import os
 import random
 import time
-from collections import OrderedDict
 from typing import List, Tuple, Any, Dict
 
 # Handle both module and direct execution
@@ -41,7 +41,8 @@ class BPlusTreeFuzzTester:
 
         # Initialize data structures
         self.btree = BPlusTreeMap(capacity=capacity)
-        self.reference = OrderedDict()
+        self.reference: Dict[Any, Any] = {}
+        self.prepopulated_keys: List[Any] = []
 
         # Pre-populate if requested
         if prepopulate > 0:
@@ -95,7 +96,8 @@ class BPlusTreeFuzzTester:
                 keys_to_insert.add(key)
 
             # Insert all keys
-            for key in sorted(keys_to_insert):
+            self.prepopulated_keys = sorted(keys_to_insert)
+            for key in self.prepopulated_keys:
                 value = f"prepop_value_{key}"
                 self.btree[key] = value
                 self.reference[key] = value
@@ -301,10 +303,9 @@ class BPlusTreeFuzzTester:
             print(f"Keys expected in tree but missing: {missing_keys}")
             return False
 
-        # Manually delete from reference
-        for key in keys_to_delete:
-            if key in self.reference:
-                del self.reference[key]
+        # Manually delete from reference, visiting only keys it holds
+        for key in self.reference.keys() & keys_to_delete:
+            del self.reference[key]
 
         self.log_operation("batch_delete", keys_to_delete, expected_deletions)
         return True
@@ -329,7 +330,7 @@ class BPlusTreeFuzzTester:
             (self.do_insert_or_update, 50),  # 50% inserts/updates
             (self.do_delete, 35),  # 35% deletes
             (self.do_get, 15),  # 15% gets
-            # Note: batch_delete removed - not implemented yet
+            (self.do_batch_delete, 5),  # batch deletes via delete_batch()
             # (self.do_compact, 5),  # 5% compactions - removed as no-op
         ]
 
@@ -390,8 +391,19 @@ class BPlusTreeFuzzTester:
         print(f"Seed: {self.seed}")
         print(f"Capacity: {self.capacity}")
 
-        # Save ALL operations to file for complete reproduction
+        # Save ALL operations to file for complete reproduction. The operations
+        # are written as one OPS tuple replayed by a small dispatch loop rather
+        # than as inline statements, so long traces stay fast to load and run
         filename = f"fuzz_failure_{self.seed}_{failed_at}.py"
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        opcodes = {
+            "insert": INSERT,
+            "update": INSERT,
+            "delete": DELETE,
+            "batch_delete": BATCH_DELETE,
+            "get": GET,
+            "delete_nonexistent": DELETE_MISSING,
+        }
 
         with open(filename, "w") as f:
             f.write(f'"""\nFuzz test failure reproduction\n')
@@ -400,76 +412,132 @@ class BPlusTreeFuzzTester:
             f.write(f"Prepopulate: {self.prepopulate}\n")
             f.write(f"Failed at operation: {failed_at}\n")
             f.write(f'"""\n\n')
-            f.write("from ..bplustree import BPlusTreeMap\n")
-            f.write("from collections import OrderedDict\n")
-            f.write("from ._invariant_checker import BPlusTreeInvariantChecker\n")
-            f.write("import random\n\n")
-            f.write("def check_invariants(tree):\n")
-            f.write("    checker = BPlusTreeInvariantChecker(tree.capacity)\n")
-            f.write("    return checker.check_invariants(tree.root, tree.leaves)\n\n")
-            f.write("def reproduce_failure():\n")
-            f.write(f"    # Initialize with same settings\n")
-            f.write(f"    random.seed({self.seed})\n")
-            f.write(f"    tree = BPlusTreeMap(capacity={self.capacity})\n")
-            f.write("    reference = OrderedDict()\n\n")
-
-            # Add prepopulation if it was used
-            if self.prepopulate > 0:
-                f.write(f"    # Recreate prepopulation\n")
-                f.write(
-                    f"    random.seed({self.seed + 12345})  # Same offset as original\n"
-                )
-                f.write(f"    keys_to_insert = set()\n")
-                f.write(f"    while len(keys_to_insert) < {self.prepopulate}:\n")
-                f.write(f"        if len(keys_to_insert) < {self.prepopulate // 2}:\n")
-                f.write(
-                    f"            key = len(keys_to_insert) * 3 + random.randint(1, 2)\n"
-                )
-                f.write(f"        else:\n")
-                f.write(
-                    f"            key = random.randint(1, {self.prepopulate * 10})\n"
-                )
-                f.write(f"        keys_to_insert.add(key)\n")
-                f.write(f"    for key in sorted(keys_to_insert):\n")
-                f.write(f'        value = f"prepop_value_{{key}}"\n')
-                f.write(f"        tree[key] = value\n")
-                f.write(f"        reference[key] = value\n")
-                f.write(f'    assert check_invariants(tree), "Prepopulation failed"\n')
-                f.write(f"    random.seed({self.seed})  # Reset to test seed\n\n")
-
-            for i, (op_type, key, value, extra) in enumerate(self.operations):
-                f.write(f"    # Operation {i + 1}: {op_type}\n")
-
-                if op_type in ["insert", "update"]:
-                    f.write(f"    tree[{repr(key)}] = {repr(value)}\n")
-                    f.write(f"    reference[{repr(key)}] = {repr(value)}\n")
-                elif op_type == "delete":
-                    f.write(f"    del tree[{repr(key)}]\n")
-                    f.write(f"    del reference[{repr(key)}]\n")
-                elif op_type == "batch_delete":
-                    f.write(f"    keys_to_delete = {repr(key)}\n")
-                    f.write(f"    tree.delete_batch(keys_to_delete)\n")
-                    f.write(f"    for k in keys_to_delete:\n")
-                    f.write(f"        if k in reference: del reference[k]\n")
-                elif op_type == "compact":
-                    f.write(f"    tree.compact()\n")
-
-                f.write(
-                    f'    assert check_invariants(tree), "Invariants failed at step {i+1}"\n\n'
-                )
-
-            f.write("    # Verify final consistency\n")
-            f.write('    assert len(tree) == len(reference), "Length mismatch"\n')
-            f.write("    for key, value in reference.items():\n")
-            f.write('        assert tree[key] == value, f"Value mismatch for {key}"\n')
-            f.write('    print("Reproduction completed successfully")\n\n')
-            f.write('if __name__ == "__main__":\n')
-            f.write("    reproduce_failure()\n")
+            f.write("import os\n")
+            f.write("import sys\n\n")
+            f.write(f"sys.path.insert(0, {package_dir!r})\n\n")
+            f.write("from bplustree.bplus_tree import BPlusTreeMap\n")
+            f.write(
+                "from tests._invariant_checker import BPlusTreeInvariantChecker\n\n"
+            )
+            f.write(f"CAPACITY = {self.capacity}\n")
+            f.write(f"PREPOPULATE = {tuple(self.prepopulated_keys)!r}\n\n")
+            f.write(
+                f"INSERT, DELETE, BATCH_DELETE, GET, DELETE_MISSING = "
+                f"{INSERT}, {DELETE}, {BATCH_DELETE}, {GET}, {DELETE_MISSING}\n\n"
+            )
+            f.write("# One (opcode, *args) tuple per logged operation\n")
+            f.write("OPS = (\n")
+            for op_type, key, value, extra in self.operations:
+                opcode = opcodes.get(op_type)
+                if opcode == INSERT:
+                    op = (opcode, key, value)
+                elif opcode == BATCH_DELETE:
+                    op = (opcode, tuple(key))
+                elif opcode is not None:
+                    op = (opcode, key)
+                else:
+                    continue  # compact is a no-op
+                f.write(f"    {op!r},\n")
+            f.write(")\n\n\n")
+            f.write(_REPLAY_DRIVER)
 
         print(f"Failure reproduction saved to: {filename}")
         print("Run the saved file to reproduce the exact failure scenario")
 
 
+# Opcodes of the OPS trace written by _save_failure_info
+INSERT, DELETE, BATCH_DELETE, GET, DELETE_MISSING = range(5)
+
+# Replays OPS against a fresh tree and a reference dict, checking invariants
+# after every step unless FUZZ_CHECK_INVARIANTS=0 or FUZZ_CHECK_STRIDE says
+# otherwise. FUZZ_BATCH_DELETES=1 fuses runs of deletes into delete_batch calls
+_REPLAY_DRIVER = """# Invariant checks walk the whole tree; a stride > 1 checks every Nth step
+CHECK_INVARIANTS = os.environ.get("FUZZ_CHECK_INVARIANTS", "1") == "1"
+CHECK_STRIDE = int(os.environ.get("FUZZ_CHECK_STRIDE", "1"))
+# Off by default: a fused run takes the batch code path, not the one that failed
+BATCH_DELETES = os.environ.get("FUZZ_BATCH_DELETES", "0") == "1"
+
+
+def check_invariants(tree):
+    checker = BPlusTreeInvariantChecker(tree.capacity)
+    return checker.check_invariants(tree.root, tree.leaves)
+
+
+def insert(tree, reference, key, value):
+    tree[key] = value
+    reference[key] = value
+
+
+def delete(tree, reference, key):
+    del tree[key]
+    del reference[key]
+
+
+def batch_delete(tree, reference, keys):
+    tree.delete_batch(keys)
+    for key in reference.keys() & keys:
+        del reference[key]
+
+
+def get(tree, reference, key):
+    assert tree.get(key, "NOT_FOUND") == reference.get(key, "NOT_FOUND"), key
+
+
+def delete_missing(tree, reference, key):
+    try:
+        del tree[key]
+    except KeyError:
+        return
+    raise AssertionError(f"deleted missing key {key!r}")
+
+
+HANDLERS = (insert, delete, batch_delete, get, delete_missing)
+
+
+# Collapse each run of consecutive DELETE ops into one BATCH_DELETE
+def fuse_deletes(ops):
+    fused = []
+    run = []
+    for op in ops + ((None,),):  # The sentinel flushes a trailing run
+        if op[0] == DELETE:
+            run.append(op[1])
+            continue
+        if len(run) == 1:
+            fused.append((DELETE, run[0]))
+        elif run:
+            fused.append((BATCH_DELETE, tuple(run)))
+        run = []
+        fused.append(op)
+    return tuple(fused[:-1])
+
+
+def reproduce_failure():
+    tree = BPlusTreeMap(capacity=CAPACITY)
+    reference = {}
+    for key in PREPOPULATE:
+        insert(tree, reference, key, f"prepop_value_{key}")
+    assert check_invariants(tree), "Prepopulation failed"
+
+    ops = fuse_deletes(OPS) if BATCH_DELETES else OPS
+    for step, (opcode, *args) in enumerate(ops, 1):
+        HANDLERS[opcode](tree, reference, *args)
+        if CHECK_INVARIANTS and step % CHECK_STRIDE == 0:
+            assert check_invariants(tree), f"Invariants failed at step {step}"
+    if CHECK_INVARIANTS:
+        assert check_invariants(tree), "Invariants failed after the last step"
+
+    # Verify final consistency
+    assert len(tree) == len(reference), "Length mismatch"
+    for key, value in reference.items():
+        assert tree[key] == value, f"Value mismatch for {key}"
+    print("Reproduction completed successfully")
+
+
+if __name__ == "__main__":
+    reproduce_failure()
+"""
+
+
 def run_quick_fuzz_test():
     """Run a smaller fuzz test for development/testing"""
     tester = BPlusTreeFuzzTester(
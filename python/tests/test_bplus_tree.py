@@ -2,6 +2,9 @@
 Tests for B+ Tree implementation
 """
 
+import random
+import sys
+
 import pytest
 from bplustree.bplus_tree import BPlusTreeMap, LeafNode, BranchNode
 from ._invariant_checker import BPlusTreeInvariantChecker
@@ -13,6 +16,14 @@ def check_invariants(tree: BPlusTreeMap) -> bool:
     return checker.check_invariants(tree.root, tree.leaves)
 
 
+def all_leaves(tree: BPlusTreeMap):
+    """Walk the leaf chain from the leftmost leaf"""
+    node = tree.leaves
+    while node is not None:
+        yield node
+        node = node.next
+
+
 class TestBasicOperations:
     """Test basic B+ tree operations"""
 
@@ -182,6 +193,144 @@ class TestSetItemSplitting:
 
         check_no_overfull(tree.root)
 
+    def test_sequential_inserts_fill_left_leaves(self):
+        """Test that ascending inserts split the rightmost leaf unevenly"""
+        tree = BPlusTreeMap(capacity=8)
+
+        for i in range(100):
+            tree[i] = i
+            assert check_invariants(tree), f"Invariants violated after inserting {i}"
+
+        # Every leaf except the last keeps capacity + 1 - min_keys entries
+        leaf = tree.leaves
+        while leaf.next is not None:
+            assert len(leaf.keys) == 6
+            leaf = leaf.next
+
+    def test_descending_inserts_split_evenly(self):
+        """Test that only appends past the rightmost key use the uneven split"""
+        tree = BPlusTreeMap(capacity=8)
+
+        for i in reversed(range(100)):
+            tree[i] = i
+
+        assert check_invariants(tree)
+        assert list(tree.keys()) == list(range(100))
+
+    def test_leaf_count_tracks_splits_and_merges(self):
+        """Test that the maintained leaf count matches a walk of the leaf chain"""
+
+        random.seed(3)
+        tree = BPlusTreeMap(capacity=4)
+        keys = list(range(300))
+        random.shuffle(keys)
+
+        for key in keys:
+            tree[key] = key
+        assert tree.leaf_count() == len(list(all_leaves(tree)))
+
+        for key in keys[:250]:
+            del tree[key]
+            assert tree.leaf_count() == len(list(all_leaves(tree)))
+
+        tree.clear()
+        assert tree.leaf_count() == 1
+
+    def test_iteration_yields_keys_in_order(self):
+        """Test that iterating the tree yields its keys like a dict"""
+        tree = BPlusTreeMap(capacity=4)
+        for key in [5, 3, 9, 1, 7, 2, 8]:
+            tree[key] = str(key)
+
+        assert list(tree) == [1, 2, 3, 5, 7, 8, 9]
+        assert dict(tree.items()) == {key: str(key) for key in tree}
+
+    def test_size_tracks_every_mutation(self):
+        """Test that the maintained size matches the keys actually stored"""
+        random.seed(9)
+        tree = BPlusTreeMap(capacity=4)
+        reference = {}
+
+        def check():
+            assert len(tree) == len(reference) == tree.leaves.key_count()
+
+        for _ in range(500):
+            key = random.randrange(200)
+            tree[key] = key
+            reference[key] = key
+        check()
+
+        batch = [(random.randrange(300), n) for n in range(100)]
+        tree.update(batch)
+        reference.update(batch)
+        check()
+
+        doomed = [random.randrange(300) for _ in range(100)]
+        assert tree.delete_batch(doomed) == len(set(doomed) & reference.keys())
+        for key in doomed:
+            reference.pop(key, None)
+        check()
+
+        key, _ = tree.popitem()
+        del reference[key]
+        assert tree.pop(-1, None) is None
+        check()
+
+        tree.clear()
+        reference.clear()
+        check()
+
+        tree = BPlusTreeMap.from_sorted_items([(i, i) for i in range(50)], capacity=4)
+        tree[50] = 50
+        assert len(tree) == 51
+
+    def test_ascending_inserts_append_to_rightmost_leaf(self):
+        """Test that ascending inserts, with splits, build a valid tree"""
+        tree = BPlusTreeMap(capacity=4)
+        for key in range(500):
+            tree[key] = key
+            assert tree._rightmost_leaf.keys[-1] == key
+
+        assert check_invariants(tree)
+        assert list(tree.items()) == [(key, key) for key in range(500)]
+
+        # Keys at or below the current maximum still take the normal path
+        tree[499] = "updated"
+        tree[-1] = "first"
+        assert tree[499] == "updated"
+        assert list(tree.keys()) == list(range(-1, 500))
+
+    def test_rightmost_leaf_tracks_splits_and_merges(self):
+        """Test that the tracked rightmost leaf is always the last leaf"""
+        random.seed(5)
+        tree = BPlusTreeMap(capacity=4)
+        keys = list(range(300))
+        random.shuffle(keys)
+
+        for key in keys:
+            tree[key] = key
+            assert tree._rightmost_leaf is list(all_leaves(tree))[-1]
+
+        for key in keys[:290]:
+            del tree[key]
+            assert tree._rightmost_leaf is list(all_leaves(tree))[-1]
+
+    def test_string_separators_are_interned(self):
+        """Test that string separators share the interned leaf key"""
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(20):
+            tree["".join(["key", str(i).zfill(3)])] = i
+
+        root = tree.root
+        assert isinstance(root, BranchNode)
+        for index, separator in enumerate(root.keys):
+            assert separator is sys.intern(separator)
+            assert (
+                root.children[index + 1].find_leaf_for_key(separator).keys[0]
+                is separator
+            )
+        assert check_invariants(tree)
+
 
 class TestLeafNode:
     """Test LeafNode operations"""
@@ -246,10 +395,87 @@ class TestLeafNode:
         assert leaf.find_position(25) == (2, False)  # Between 20 and 30
         assert leaf.find_position(35) == (3, False)  # After all
 
+    def test_key_count_longer_than_recursion_limit(self):
+        """Test key_count walks a leaf chain longer than the recursion limit"""
+        leaf_total = sys.getrecursionlimit() + 100
+        tree = BPlusTreeMap.from_sorted_items(
+            ((i, i) for i in range(leaf_total * 4)), capacity=4
+        )
+
+        assert tree.leaf_count() >= leaf_total
+        assert tree.leaves.key_count() == leaf_total * 4
+        assert len(tree) == leaf_total * 4
+
 
 class TestRemoval:
     """Test B+ tree removal operations"""
 
+    def test_remove_key_with_none_value(self):
+        """Test that a key stored with a None value can be deleted"""
+        tree = BPlusTreeMap(capacity=4)
+        tree[1] = None
+        tree[2] = "two"
+
+        del tree[1]
+
+        assert 1 not in tree
+        assert len(tree) == 1
+        with pytest.raises(KeyError):
+            del tree[1]
+
+    def test_delete_batch(self):
+        """Test deleting a batch of keys, some of them missing"""
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(100):
+            tree[i] = i
+
+        deleted = tree.delete_batch([5, 50, 500, 7, -1, 99, 5])
+
+        assert deleted == 4
+        assert list(tree.keys()) == [i for i in range(100) if i not in (5, 7, 50, 99)]
+        assert check_invariants(tree)
+
+    def test_delete_batch_everything(self):
+        """Test that deleting every key in one batch leaves a valid empty tree"""
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(200):
+            tree[i] = i
+
+        assert tree.delete_batch(reversed(range(200))) == 200
+        assert len(tree) == 0
+        assert check_invariants(tree)
+
+    def test_delete_batch_large_unsorted(self):
+        """Test the sorted leaf-cursor path against a dict"""
+        random.seed(9)
+        tree = BPlusTreeMap(capacity=5)
+        expected = {}
+        for _ in range(1500):
+            key = random.randrange(3000)
+            tree[key] = key
+            expected[key] = key
+
+        batch = [random.randrange(3200) for _ in range(900)]
+        deleted = tree.delete_batch(batch)
+
+        assert deleted == len(set(batch) & expected.keys())
+        for key in batch:
+            expected.pop(key, None)
+        assert list(tree.items()) == sorted(expected.items())
+        assert check_invariants(tree)
+
+    def test_delete_batch_presorted(self):
+        """Test presorted batches, including a caller that gets the order wrong"""
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(300):
+            tree[i] = i
+
+        assert tree.delete_batch(range(0, 300, 3), presorted=True) == 100
+        assert tree.delete_batch([299, 1, 150, 2], presorted=True) == 3
+        assert 1 not in tree and 2 not in tree and 299 not in tree
+        assert len(tree) == 197
+        assert check_invariants(tree)
+
     def test_remove_single_item_from_leaf_root(self):
         """Test removing a single item when root is a leaf"""
         tree = BPlusTreeMap(capacity=4)
@@ -440,6 +666,36 @@ class TestNodeUnderflow:
         branch.keys.append(15)
         assert not branch.is_underfull()
 
+    def test_empty_branch_borrows_when_merge_would_overflow(self):
+        """Test that a keyless branch borrows from a sibling too full to merge"""
+        tree = BPlusTreeMap(capacity=4)
+
+        def leaf_with(*keys):
+            leaf = LeafNode(4)
+            for key in keys:
+                leaf.insert(key, key)
+            return leaf
+
+        # Left branch holds the maximum 4 keys, so 4 + 0 + 1 keys won't merge
+        left = BranchNode(4)
+        left.keys = [10, 20, 30, 40]
+        left.children = [leaf_with(k, k + 1) for k in (1, 10, 20, 30, 40)]
+        empty = BranchNode(4)
+        empty.children = [leaf_with(60, 61)]
+        root = BranchNode(4)
+        root.keys = [50]
+        root.children = [left, empty]
+        leaves = left.children + empty.children
+        for leaf, next_leaf in zip(leaves, leaves[1:]):
+            leaf.next = next_leaf
+        tree.root = root
+        tree.leaves = leaves[0]
+
+        tree._handle_underflow(root, 1)
+
+        assert check_invariants(tree)
+        assert list(tree.keys()) == [1, 2, 10, 11, 20, 21, 30, 31, 40, 41, 60, 61]
+
     def test_underflow_after_deletion_creates_violation(self):
         """Test that deleting keys can create underflow violations"""
         tree = BPlusTreeMap(capacity=4)
@@ -693,6 +949,51 @@ class TestSiblingRedistribution:
         assert len(right.children) == 3
         assert new_separator == 15
 
+    def test_leaf_borrow_evens_out_siblings(self):
+        """Test that a leaf borrows several entries at once to even out"""
+        left = LeafNode(capacity=16)
+        right = LeafNode(capacity=16)
+        left.keys = list(range(1, 15))
+        left.values = [str(k) for k in left.keys]
+        right.keys = [20, 21]
+        right.values = ["20", "21"]
+
+        right.borrow_from_left(left)
+        assert left.keys == list(range(1, 9))
+        assert right.keys == [9, 10, 11, 12, 13, 14, 20, 21]
+        assert right.values == [str(k) for k in right.keys]
+
+        left.keys = [1, 2]
+        left.values = ["1", "2"]
+        left.borrow_from_right(right)
+        assert left.keys == [1, 2, 9, 10, 11]
+        assert right.keys == [12, 13, 14, 20, 21]
+        assert right.values == [str(k) for k in right.keys]
+
+    def test_branch_borrow_evens_out_siblings(self):
+        """Test that a branch borrows several children at once to even out"""
+        left = BranchNode(capacity=8)
+        right = BranchNode(capacity=8)
+        left.keys = [10, 20, 30, 40, 50, 60, 70]
+        left.children = [LeafNode(8) for _ in range(8)]
+        moved = left.children[5:]
+        right.keys = [90]
+        right.children = [LeafNode(8), LeafNode(8)]
+
+        new_separator = right.borrow_from_left(left, 80)
+        assert new_separator == 50
+        assert left.keys == [10, 20, 30, 40]
+        assert right.keys == [60, 70, 80, 90]
+        assert right.children[:3] == moved
+        assert len(left.children) == 5 and len(right.children) == 5
+
+        new_separator = left.borrow_from_right(right, new_separator)
+        assert new_separator == 60
+        assert left.keys == [10, 20, 30, 40, 50]
+        assert right.keys == [70, 80, 90]
+        assert left.children[-1] is moved[0]
+        assert len(left.children) == 6 and len(right.children) == 4
+
     def test_redistribution_during_deletion(self):
         """Test that underflow handling (redistribution or merging) works during deletion"""
         tree = BPlusTreeMap(capacity=4)
@@ -903,5 +1204,100 @@ class TestNodeMerging:
             assert tree[key] == f"value_{key}"
 
 
+class TestBulkLoading:
+    """Test bottom-up construction in from_sorted_items"""
+
+    @pytest.mark.parametrize("capacity", [4, 5, 8, 16])
+    def test_bulk_load_sizes(self, capacity):
+        """Test every size up to a few levels deep builds a valid tree"""
+        for size in range(0, capacity * (capacity + 1) * 2):
+            items = [(i, i * 10) for i in range(size)]
+            tree = BPlusTreeMap.from_sorted_items(items, capacity=capacity)
+
+            assert check_invariants(tree), f"Invariants violated for {size} items"
+            assert list(tree.items()) == items
+            assert tree.leaf_count() == len(list(all_leaves(tree)))
+
+    def test_bulk_load_packs_leaves(self):
+        """Test that all leaves but the last two are filled to capacity"""
+        tree = BPlusTreeMap.from_sorted_items([(i, i) for i in range(1000)], capacity=8)
+
+        leaves = list(all_leaves(tree))
+        assert all(len(leaf.keys) == 8 for leaf in leaves[:-2])
+
+    @pytest.mark.parametrize("fill_factor", [0.1, 0.5, 0.75])
+    def test_bulk_load_fill_factor(self, fill_factor):
+        """Test partially filled bulk loads stay valid and leave room"""
+        for size in range(0, 300, 7):
+            items = [(i, i) for i in range(size)]
+            tree = BPlusTreeMap.from_sorted_items(
+                items, capacity=16, fill_factor=fill_factor
+            )
+
+            assert check_invariants(tree), f"Invariants violated for {size} items"
+            assert list(tree.items()) == items
+
+        leaves = list(all_leaves(tree))
+        assert max(len(leaf.keys) for leaf in leaves) < 16
+
+    def test_bulk_load_rejects_bad_fill_factor(self):
+        with pytest.raises(ValueError):
+            BPlusTreeMap.from_sorted_items([(1, 1)], capacity=4, fill_factor=0)
+
+    def test_bulk_loaded_tree_accepts_updates(self):
+        """Test inserting into and deleting from a bulk-loaded tree"""
+        tree = BPlusTreeMap.from_sorted_items(
+            [(i, i) for i in range(0, 500, 2)], capacity=4
+        )
+
+        for i in range(1, 500, 2):
+            tree[i] = i
+        for i in range(0, 500, 3):
+            del tree[i]
+
+        assert check_invariants(tree)
+        assert list(tree.keys()) == [i for i in range(500) if i % 3]
+
+    def test_unsorted_input_falls_back(self):
+        """Test that out-of-order or repeated keys still load correctly"""
+        tree = BPlusTreeMap.from_sorted_items(
+            [(3, "c"), (1, "a"), (2, "b"), (2, "B")], capacity=4
+        )
+
+        assert check_invariants(tree)
+        assert list(tree.items()) == [(1, "a"), (2, "B"), (3, "c")]
+
+    def test_bulk_load_from_generator(self):
+        """Test that iterator input is loaded chunk by chunk"""
+        tree = BPlusTreeMap.from_sorted_items(
+            ((i, i * 2) for i in range(1000)), capacity=8
+        )
+
+        assert check_invariants(tree)
+        assert list(tree.items()) == [(i, i * 2) for i in range(1000)]
+        assert len(tree) == 1000
+
+    def test_out_of_order_key_mid_stream(self):
+        """Test that a disorder after many sorted leaves still loads correctly"""
+        items = [(i, i) for i in range(500)] + [(100, "again")]
+        items += [(i, i) for i in range(500, 600)]
+        tree = BPlusTreeMap.from_sorted_items(iter(items), capacity=4)
+
+        assert check_invariants(tree)
+        assert len(tree) == 600
+        assert tree[100] == "again"
+        assert list(tree.keys()) == list(range(600))
+
+    def test_fallback_appends_split_along_right_spine(self):
+        """Test the per-item fallback grows a deep tree through appends"""
+        items = [(i, i) for i in range(2000)] + [(1999, "last")]
+        tree = BPlusTreeMap.from_sorted_items(items, capacity=4)
+
+        assert check_invariants(tree)
+        assert len(tree) == 2000
+        assert tree[1999] == "last"
+        assert tree._rightmost_leaf is list(all_leaves(tree))[-1]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -4,6 +4,7 @@ Comprehensive test suite for C extension to identify and fix all bugs.
 
 import sys
 import os
+import itertools
 import random
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,6 +13,7 @@ import pytest
 
 try:
     import bplustree_c
+
     HAS_C_EXTENSION = True
 except ImportError as e:
     pytest.skip(f"C extension not available: {e}", allow_module_level=True)
@@ -201,6 +203,34 @@ def test_iteration_order():
     print("✓ Iteration order tests passed")
 
 
+def test_range_items():
+    """Test that items() honours start_key and end_key."""
+    print("Testing range items...")
+    tree = bplustree_c.BPlusTree(capacity=4)
+    for i in range(0, 100, 2):
+        tree[i] = i
+
+    for start_key, end_key in [
+        (None, None),
+        (7, None),
+        (None, 51),
+        (7, 51),
+        (12, 12),
+        (51, 7),
+        (200, None),
+    ]:
+        expected = [
+            (key, key)
+            for key in range(0, 100, 2)
+            if (start_key is None or key >= start_key)
+            and (end_key is None or key < end_key)
+        ]
+        assert list(tree.items(start_key, end_key)) == expected
+        assert list(tree.items(start_key=start_key, end_key=end_key)) == expected
+
+    print("✓ Range items tests passed")
+
+
 def test_large_capacity():
     """Test with larger capacity to ensure it works without frequent splits."""
     print("Testing with large capacity (128)...")
@@ -266,6 +296,165 @@ def test_mixed_types():
         print(f"Mixed types not supported (expected): {e}")
 
 
+def test_bulk_load():
+    """Test bottom-up bulk loading of sorted pairs."""
+    print("Testing bulk load...")
+    for capacity in [4, 5, 8, 32]:
+        for size, fill_factor in itertools.product(
+            [0, 1, capacity, capacity + 1, 1000], [1.0, 0.7, 0.1]
+        ):
+            items = [(i, str(i)) for i in range(size)]
+            tree = bplustree_c.BPlusTree(capacity=capacity)
+            assert tree._bulk_load(items, fill_factor) is True
+
+            assert len(tree) == size
+            assert list(tree.items()) == items
+            for key, value in items[::7]:
+                assert tree[key] == value
+
+            # The bulk-built tree keeps accepting inserts and deletes
+            for i in range(size, size + 50):
+                tree[i] = str(i)
+            for i in range(0, size, 3):
+                del tree[i]
+            expected = [i for i in range(size + 50) if i >= size or i % 3]
+            assert list(tree.keys()) == expected
+
+    # Unsorted input leaves the tree untouched for the caller to fall back on
+    tree = bplustree_c.BPlusTree(capacity=4)
+    assert tree._bulk_load([(2, "b"), (1, "a")]) is False
+    assert len(tree) == 0
+
+    with pytest.raises(TypeError):
+        tree._bulk_load([1, 2])
+
+    for fill_factor in [0.0, 1.5]:
+        with pytest.raises(ValueError):
+            tree._bulk_load([(1, "a")], fill_factor)
+
+    tree[1] = "a"
+    with pytest.raises(ValueError):
+        tree._bulk_load([(2, "b")])
+
+    print("✓ Bulk load tests passed")
+
+
+def test_bulk_load_min_occupancy():
+    """Test that bulk loading never leaves a node below its minimum."""
+    print("Testing bulk load occupancy...")
+    for capacity in [4, 5, 8, 9]:
+        min_keys = capacity // 2
+        for fill_factor in [1.0, 0.7, 0.5, 0.1]:
+            for size in range(1, 200):
+                tree = bplustree_c.BPlusTree(capacity=capacity)
+                assert tree._bulk_load([(i, i) for i in range(size)], fill_factor)
+
+                levels = tree._node_sizes()
+                # Leaves hold keys; a branch with k separators has k + 1 children
+                assert sum(levels[-1]) == size
+                for level in levels[1:]:
+                    assert all(min_keys <= keys <= capacity for keys in level), (
+                        capacity,
+                        fill_factor,
+                        size,
+                        levels,
+                    )
+                assert list(tree.keys()) == list(range(size))
+
+    print("✓ Bulk load occupancy tests passed")
+
+
+def test_delete_batch():
+    """Test deleting many keys in one leaf-chain sweep."""
+    print("Testing delete batch...")
+    random.seed(17)
+    for capacity in [4, 8, 32]:
+        tree = bplustree_c.BPlusTree(capacity=capacity)
+        reference = {}
+        keys = list(range(3000))
+        random.shuffle(keys)
+        for key in keys:
+            tree[key] = str(key)
+            reference[key] = str(key)
+
+        # Missing and repeated keys are skipped
+        doomed = random.sample(range(-100, 3100), 2000) + [5, 5]
+        expected = len(set(doomed) & set(reference))
+        assert tree.delete_batch(doomed) == expected
+        for key in doomed:
+            reference.pop(key, None)
+        assert list(tree.items()) == sorted(reference.items())
+        assert len(tree) == len(reference)
+
+        # Presorted input that goes backwards still deletes every key
+        doomed = [2999, 1, 2, 3, 100]
+        tree.delete_batch(doomed, presorted=True)
+        for key in doomed:
+            reference.pop(key, None)
+        assert list(tree.items()) == sorted(reference.items())
+
+        # Emptying the tree leaves it usable
+        assert tree.delete_batch(iter(list(reference))) == len(reference)
+        assert len(tree) == 0
+        for key in range(100):
+            tree[key] = key
+        assert list(tree.keys()) == list(range(100))
+
+    print("✓ Delete batch tests passed")
+
+
+def test_range_update():
+    """Test in-place value updates over a key range."""
+    print("Testing range update...")
+    for start_key, end_key in [(None, None), (7, None), (None, 51), (7, 51), (51, 7)]:
+        tree = bplustree_c.BPlusTree(capacity=4)
+        for i in range(0, 100, 2):
+            tree[i] = i
+        expected = dict(tree.items())
+        in_range = [
+            key
+            for key in expected
+            if (start_key is None or key >= start_key)
+            and (end_key is None or key < end_key)
+        ]
+        for key in in_range:
+            expected[key] *= 10
+
+        assert tree.range_update(start_key, end_key, lambda v: v * 10) == len(in_range)
+        assert list(tree.items()) == sorted(expected.items())
+
+    # Errors from the callable propagate; values updated so far stay updated
+    tree = bplustree_c.BPlusTree(capacity=4)
+    for i in range(10):
+        tree[i] = i
+    with pytest.raises(ZeroDivisionError):
+        tree.range_update(None, None, lambda v: 1 // (5 - v))
+
+    # Mutating the tree from the callable is refused
+    with pytest.raises(RuntimeError):
+        tree.range_update(None, None, lambda v: tree.__delitem__(9))
+
+    # So is mutating it from a replaced value's destructor
+    tree = bplustree_c.BPlusTree(capacity=16)
+
+    class DeletesLaterKeys:
+        def __init__(self, key):
+            self.key = key
+
+        def __del__(self):
+            for key in range(self.key + 1, 8):
+                if key in tree:
+                    del tree[key]
+
+    for key in range(8):
+        tree[key] = DeletesLaterKeys(key)
+    with pytest.raises(RuntimeError):
+        tree.range_update(None, None, lambda v: 0)
+    assert list(tree.items()) == [(0, 0)]
+
+    print("✓ Range update tests passed")
+
+
 def run_all_tests():
     """Run all tests and report results."""
     if not HAS_C_EXTENSION:
@@ -283,9 +472,14 @@ def run_all_tests():
         test_duplicate_keys,
         test_key_error,
         test_iteration_order,
+        test_range_items,
         test_large_capacity,
         test_string_keys,
         test_mixed_types,
+        test_bulk_load,
+        test_bulk_load_min_occupancy,
+        test_delete_batch,
+        test_range_update,
     ]
 
     passed = 0
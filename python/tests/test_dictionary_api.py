@@ -65,6 +65,17 @@ class TestDictionaryAPI:
         # Test that tree is unchanged
         assert len(self.tree) == 10
 
+    def test_get_batch(self):
+        """Test get_batch() matches get() and keeps the query order."""
+        # Short batches look keys up one by one
+        assert self.tree.get_batch([3, 100]) == ["value_3", None]
+
+        # Long batches go through the sorted leaf cursor
+        queries = [9, -1, 4, 4, 100, 0, 7, 2]
+        assert self.tree.get_batch(iter(queries), "default") == [
+            self.tree.get(key, "default") for key in queries
+        ]
+
     def test_pop_with_key_present(self):
         """Test pop() when key exists."""
         # Pop existing key
@@ -352,6 +363,25 @@ class TestDictionaryAPILargeDataset:
         assert len(tree) == 0
         assert len(copied) == 1000  # Copy should be unaffected
 
+    def test_large_unsorted_batch_update(self):
+        """Test update() with an unsorted batch larger than the node capacity."""
+        import random
+
+        random.seed(42)
+        tree = BPlusTreeMap(capacity=8)
+        expected = {}
+        for i in range(0, 2000, 3):
+            tree[i] = "existing"
+            expected[i] = "existing"
+
+        # Includes updates of existing keys and repeated keys within the batch
+        batch = [(random.randrange(2500), n) for n in range(3000)]
+        tree.update(batch)
+        expected.update(batch)
+
+        assert list(tree.items()) == sorted(expected.items())
+        assert len(tree) == len(expected)
+
 
 if __name__ == "__main__":
     # Run the tests
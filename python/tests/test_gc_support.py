@@ -21,3 +21,38 @@ def test_gc_collects_self_referencing_tree():
 
     # After GC, the self-referenced tree should be collected
     assert not any(obj_id == tree_id for obj_id in map(id, gc.get_objects()))
+
+
+def test_split_nodes_release_keys_and_values():
+    """Leaf and branch splits must not leave extra references behind."""
+    import functools
+    import weakref
+
+    @functools.total_ordering
+    class Key:
+        def __init__(self, n):
+            self.n = n
+
+        def __eq__(self, other):
+            return self.n == other.n
+
+        def __lt__(self, other):
+            return self.n < other.n
+
+    class Value:
+        pass
+
+    tree = BPlusTree(capacity=4)
+    keys = [Key((i * 7919) % 500) for i in range(500)]
+    refs = [weakref.ref(key) for key in keys]
+    for key in keys:
+        value = Value()
+        refs.append(weakref.ref(value))
+        tree[key] = value
+    del value
+    for key in keys[::2]:
+        del tree[key]
+
+    del tree, keys, key
+    gc.collect()
+    assert all(ref() is None for ref in refs)
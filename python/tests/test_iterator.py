@@ -151,3 +151,110 @@ class TestBPlusTreeRangeIterator:
         items = list(tree.items(start_key=11))
         assert items[0] == (12, "value12")
         assert len(items) == 14  # From 12 to 38 (inclusive)
+
+
+class TestBPlusTreeBatchedIterator:
+    """Test cases for per-leaf batched iteration"""
+
+    def test_batches_match_items(self):
+        """Test that flattening the batches gives the same pairs as items()"""
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(0, 100, 2):
+            tree[i] = f"value{i}"
+
+        for start_key, end_key in [
+            (None, None),
+            (7, None),
+            (None, 51),
+            (7, 51),
+            (10, 12),
+            (12, 12),
+            (51, 7),
+            (200, None),
+        ]:
+            batches = list(tree.items_batched(start_key, end_key))
+            flattened = [pair for keys, values in batches for pair in zip(keys, values)]
+            assert flattened == list(tree.items(start_key, end_key))
+            assert all(len(keys) > 0 for keys, _ in batches)
+
+    def test_one_batch_per_leaf(self):
+        """Test that a full scan yields one batch per leaf"""
+        tree = BPlusTreeMap(capacity=8)
+        for i in range(200):
+            tree[i] = i
+
+        batches = list(tree.items_batched())
+        assert len(batches) == tree.leaf_count()
+
+    def test_empty_tree(self):
+        """Test that an empty tree yields no batches"""
+        tree = BPlusTreeMap(capacity=4)
+        assert list(tree.items_batched()) == []
+        assert list(tree.items_batched(end_key=5)) == []
+
+
+class TestRangeUpdate:
+    """Test in-place value updates over a key range"""
+
+    def test_matches_point_updates(self):
+        """Test that range_update agrees with assigning each key in the range"""
+        for start_key, end_key in [
+            (None, None),
+            (7, None),
+            (None, 51),
+            (7, 51),
+            (10, 12),
+            (12, 12),
+            (51, 7),
+            (200, None),
+        ]:
+            tree = BPlusTreeMap(capacity=4)
+            for i in range(0, 100, 2):
+                tree[i] = i
+            expected = dict(tree.items())
+            for key, value in tree.items(start_key, end_key):
+                expected[key] = value * 10
+
+            count = tree.range_update(start_key, end_key, lambda v: v * 10)
+            assert list(tree.items()) == sorted(expected.items())
+            assert count == len(list(tree.items(start_key, end_key)))
+
+    def test_empty_tree(self):
+        """Test that an empty tree updates nothing"""
+        tree = BPlusTreeMap(capacity=4)
+        assert tree.range_update(None, None, str) == 0
+        assert len(tree) == 0
+
+    def test_mutating_callable_rejected(self):
+        """Test that inserting or deleting from the callable raises"""
+        tree = BPlusTreeMap(capacity=4)
+        for i in range(10):
+            tree[i] = i
+
+        with pytest.raises(RuntimeError):
+            tree.range_update(None, None, lambda v: tree.__delitem__(9))
+        with pytest.raises(RuntimeError):
+            tree.range_update(None, None, lambda v: tree.__setitem__(v + 0.5, v))
+        # One insert and one delete leave the size unchanged but still count
+        with pytest.raises(RuntimeError):
+            tree.range_update(None, None, lambda v: (tree.pop(5), tree.setdefault(20)))
+        assert list(tree.keys()) == sorted(tree.keys())
+
+    def test_mutating_destructor_rejected(self):
+        """Test that deleting from a replaced value's destructor raises"""
+        tree = BPlusTreeMap(capacity=16)
+
+        class DeletesLaterKeys:
+            def __init__(self, key):
+                self.key = key
+
+            def __del__(self):
+                for key in range(self.key + 1, 8):
+                    if key in tree:
+                        del tree[key]
+
+        for key in range(8):
+            tree[key] = DeletesLaterKeys(key)
+        with pytest.raises(RuntimeError):
+            tree.range_update(None, None, lambda v: 0)
+        assert list(tree.items()) == [(0, 0)]
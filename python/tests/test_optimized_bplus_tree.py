@@ -1,37 +1,51 @@
 """
-Test optimized B+ tree implementation with single array nodes.
-This creates a modified B+ tree that uses the single array layout.
+Test optimized B+ tree implementation with preallocated array nodes.
+This creates a modified B+ tree whose nodes keep fixed-size parallel arrays
+(keys separate from values/children) plus a used-slot count. Numeric keys
+can be stored unboxed in an ``array.array`` by passing a key typecode.
 """
 
 import time
 import random
 import gc
 import bisect
-from typing import Any, Optional, Tuple, Iterator
+from array import array
+from typing import Any, List, Optional, Tuple, Iterator
 import sys
 import os
+import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from bplustree import BPlusTreeMap
+from bplustree.bplus_tree import _bulk_load_ranges
+
+
+def _empty_keys(key_typecode: Optional[str], count: int):
+    """Return ``count`` unused key slots: None, or zeros in a typed array."""
+    if key_typecode is None:
+        return [None] * count
+    return array(key_typecode, [0]) * count
 
 
 class OptimizedLeafNode:
-    """Leaf node with single array optimization."""
+    """Leaf node with preallocated parallel key and value arrays."""
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, key_typecode: Optional[str] = None):
         self.capacity = capacity
+        self.key_typecode = key_typecode
         self.num_keys = 0
-        # Pre-allocate single array for better memory locality
-        self.data = [None] * (capacity * 2)
+        # Pre-allocate separate arrays so searches only touch the keys
+        self.keys = _empty_keys(key_typecode, capacity)
+        self.values = [None] * capacity
         self.next: Optional["OptimizedLeafNode"] = None
 
     def is_leaf(self) -> bool:
         return True
 
     def find_position(self, key) -> int:
-        """Binary search using only the keys portion of data array."""
-        return bisect.bisect_left(self.data, key, 0, self.num_keys)
+        """Binary search over the used part of the keys array."""
+        return bisect.bisect_left(self.keys, key, 0, self.num_keys)
 
     def get_child(self, key) -> "OptimizedLeafNode":
         """Leaf nodes don't have children."""
@@ -39,205 +53,272 @@ class OptimizedLeafNode:
 
     def insert(self, key, value) -> Optional[Tuple[Any, "OptimizedLeafNode"]]:
         """Insert with optimized array access."""
-        pos = self.find_position(key)
+        # Locals instead of repeated attribute loads on this hot path
+        keys = self.keys
+        n = self.num_keys
+        pos = bisect.bisect_left(keys, key, 0, n)
 
         # Update existing key
-        if pos < self.num_keys and self.data[pos] == key:
-            self.data[self.capacity + pos] = value
+        if pos < n and keys[pos] == key:
+            self.values[pos] = value
             return None
 
         # Check if split needed
-        if self.num_keys >= self.capacity:
+        if n >= self.capacity:
             return self._split_and_insert(pos, key, value)
 
-        # Shift in single operation
-        if pos < self.num_keys:
-            # Move keys
-            self.data[pos + 1 : self.num_keys + 1] = self.data[pos : self.num_keys]
-            # Move values
-            start_val = self.capacity + pos
-            end_val = self.capacity + self.num_keys
-            self.data[start_val + 1 : end_val + 1] = self.data[start_val:end_val]
-
-        # Insert
-        self.data[pos] = key
-        self.data[self.capacity + pos] = value
-        self.num_keys += 1
+        self._insert_at(pos, key, value)
         return None
 
+    def _insert_at(self, pos: int, key, value) -> None:
+        """Insert at a known position in a node with a free slot."""
+        keys = self.keys
+        values = self.values
+        n = self.num_keys
+        # Shift in single operation
+        if pos < n:
+            keys[pos + 1 : n + 1] = keys[pos:n]
+            values[pos + 1 : n + 1] = values[pos:n]
+
+        keys[pos] = key
+        values[pos] = value
+        self.num_keys = n + 1
+
     def _split_and_insert(
         self, pos: int, key, value
     ) -> Tuple[Any, "OptimizedLeafNode"]:
-        """Split node and insert."""
-        new_node = OptimizedLeafNode(self.capacity)
-        mid = self.capacity // 2
-
-        # Create temporary sorted list with new element
-        all_keys = []
-        all_values = []
-
-        # Add existing elements before insertion point
-        for i in range(pos):
-            all_keys.append(self.data[i])
-            all_values.append(self.data[self.capacity + i])
-
-        # Add new element
-        all_keys.append(key)
-        all_values.append(value)
-
-        # Add remaining elements
-        for i in range(pos, self.num_keys):
-            all_keys.append(self.data[i])
-            all_values.append(self.data[self.capacity + i])
-
-        # Distribute to nodes
-        self.num_keys = mid
-        for i in range(mid):
-            self.data[i] = all_keys[i]
-            self.data[self.capacity + i] = all_values[i]
-
-        # Clear unused slots in old node
-        for i in range(mid, self.capacity):
-            self.data[i] = None
-            self.data[self.capacity + i] = None
-
-        # Fill new node
-        new_node.num_keys = len(all_keys) - mid
-        for i in range(new_node.num_keys):
-            new_node.data[i] = all_keys[mid + i]
-            new_node.data[new_node.capacity + i] = all_values[mid + i]
+        """Split node and insert.
+
+        The upper half is slice-copied straight into the new node and the new
+        entry is then inserted into whichever half it belongs to, so the left
+        node keeps ``capacity // 2`` entries either way.
+        """
+        new_node = OptimizedLeafNode(self.capacity, self.key_typecode)
+        n = self.num_keys
+        # When the new entry lands left of mid, one more entry moves right
+        goes_left = pos < self.capacity // 2
+        cut = self.capacity // 2 - 1 if goes_left else self.capacity // 2
+
+        moved = n - cut
+        new_node.keys[:moved] = self.keys[cut:n]
+        new_node.values[:moved] = self.values[cut:n]
+        new_node.num_keys = moved
+        self.keys[cut:n] = _empty_keys(self.key_typecode, moved)
+        self.values[cut:n] = [None] * moved
+        self.num_keys = cut
+
+        if goes_left:
+            self._insert_at(pos, key, value)
+        else:
+            new_node._insert_at(pos - cut, key, value)
 
         # Update links
         new_node.next = self.next
         self.next = new_node
 
-        return (new_node.data[0], new_node)
+        return (new_node.keys[0], new_node)
 
     def get(self, key) -> Optional[Any]:
         """Optimized lookup."""
-        pos = self.find_position(key)
-        if pos < self.num_keys and self.data[pos] == key:
-            return self.data[self.capacity + pos]
+        keys = self.keys
+        n = self.num_keys
+        pos = bisect.bisect_left(keys, key, 0, n)
+        if pos < n and keys[pos] == key:
+            return self.values[pos]
         return None
 
 
 class OptimizedBranchNode:
-    """Branch node with single array optimization."""
+    """Branch node with preallocated parallel key and child arrays."""
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, key_typecode: Optional[str] = None):
         self.capacity = capacity
+        self.key_typecode = key_typecode
         self.num_keys = 0
-        # Array layout: keys[0:capacity], children[capacity:capacity*2+1]
-        self.data = [None] * (capacity * 2 + 1)
+        # One more child slot than key slots
+        self.keys = _empty_keys(key_typecode, capacity)
+        self.children = [None] * (capacity + 1)
 
     def is_leaf(self) -> bool:
         return False
 
     def find_child_index(self, key) -> int:
         """Binary search for child index."""
-        return bisect.bisect_right(self.data, key, 0, self.num_keys)
+        return bisect.bisect_right(self.keys, key, 0, self.num_keys)
 
     def get_child(self, key):
         """Get child node for given key."""
-        index = self.find_child_index(key)
-        return self.data[self.capacity + index]
+        return self.children[self.find_child_index(key)]
 
     def set_child(self, index: int, child):
         """Set child at index."""
-        self.data[self.capacity + index] = child
+        self.children[index] = child
 
     def insert(self, key, right_child) -> Optional[Tuple[Any, "OptimizedBranchNode"]]:
         """Insert key and right child."""
-        pos = bisect.bisect_left(self.data, key, 0, self.num_keys)
+        return self.insert_at_child(
+            bisect.bisect_left(self.keys, key, 0, self.num_keys), key, right_child
+        )
 
+    def insert_at_child(
+        self, pos: int, key, right_child
+    ) -> Optional[Tuple[Any, "OptimizedBranchNode"]]:
+        """Insert ``key`` and ``right_child`` to the right of child ``pos``.
+
+        ``pos`` is the index of the child that split, as found on the way
+        down, so no search is needed.
+        """
         # Check if split needed
         if self.num_keys >= self.capacity:
             return self._split_and_insert(pos, key, right_child)
 
-        # Shift keys and children
-        if pos < self.num_keys:
-            # Shift keys
-            self.data[pos + 1 : self.num_keys + 1] = self.data[pos : self.num_keys]
-            # Shift children (one extra child)
-            start_child = self.capacity + pos + 1
-            end_child = self.capacity + self.num_keys + 1
-            self.data[start_child + 1 : end_child + 1] = self.data[
-                start_child:end_child
-            ]
-
-        # Insert
-        self.data[pos] = key
-        self.data[self.capacity + pos + 1] = right_child
-        self.num_keys += 1
+        self._insert_at(pos, key, right_child)
         return None
 
+    def _insert_at(self, pos: int, key, right_child) -> None:
+        """Insert a key and its right child in a node with a free slot."""
+        keys = self.keys
+        children = self.children
+        n = self.num_keys
+        # Shift keys and children (the child right of each key moves with it)
+        if pos < n:
+            keys[pos + 1 : n + 1] = keys[pos:n]
+            children[pos + 2 : n + 2] = children[pos + 1 : n + 1]
+
+        keys[pos] = key
+        children[pos + 1] = right_child
+        self.num_keys = n + 1
+
     def _split_and_insert(
         self, pos: int, key, right_child
     ) -> Tuple[Any, "OptimizedBranchNode"]:
-        """Split branch node."""
-        new_node = OptimizedBranchNode(self.capacity)
+        """Split branch node.
+
+        Of the ``capacity + 1`` keys (including the new one), the one at
+        ``capacity // 2`` is promoted; the halves around it are slice-copied
+        without building merged temporaries.
+        """
+        new_node = OptimizedBranchNode(self.capacity, self.key_typecode)
+        n = self.num_keys
         mid = self.capacity // 2
 
-        # Collect all keys and children
-        all_keys = []
-        all_children = []
-
-        # Add first child
-        all_children.append(self.data[self.capacity])
-
-        # Add existing elements
-        for i in range(pos):
-            all_keys.append(self.data[i])
-            all_children.append(self.data[self.capacity + i + 1])
-
-        # Add new element
-        all_keys.append(key)
-        all_children.append(right_child)
-
-        # Add remaining
-        for i in range(pos, self.num_keys):
-            all_keys.append(self.data[i])
-            all_children.append(self.data[self.capacity + i + 1])
-
-        # Split keys and children
-        split_key = all_keys[mid]
-
-        # Update current node
-        self.num_keys = mid
-        for i in range(mid):
-            self.data[i] = all_keys[i]
-        for i in range(mid + 1):
-            self.data[self.capacity + i] = all_children[i]
-
-        # Clear unused slots
-        for i in range(mid, self.capacity):
-            self.data[i] = None
-        for i in range(mid + 1, self.capacity + 1):
-            self.data[self.capacity + i] = None
-
-        # Fill new node
-        new_node.num_keys = len(all_keys) - mid - 1
-        for i in range(new_node.num_keys):
-            new_node.data[i] = all_keys[mid + 1 + i]
-        for i in range(new_node.num_keys + 1):
-            new_node.data[new_node.capacity + i] = all_children[mid + 1 + i]
+        if pos == mid:
+            # The new key itself is promoted; its child heads the right node
+            moved = n - mid
+            new_node.keys[:moved] = self.keys[mid:n]
+            new_node.children[0] = right_child
+            new_node.children[1 : moved + 1] = self.children[mid + 1 : n + 1]
+            new_node.num_keys = moved
+            self._truncate(mid)
+            return (key, new_node)
+
+        # Otherwise an existing key is promoted: keys[mid - 1] if the new key
+        # goes left (shifting it up), keys[mid] if it goes right
+        promote = mid - 1 if pos < mid else mid
+        split_key = self.keys[promote]
+        moved = n - promote - 1
+        new_node.keys[:moved] = self.keys[promote + 1 : n]
+        new_node.children[: moved + 1] = self.children[promote + 1 : n + 1]
+        new_node.num_keys = moved
+        self._truncate(promote)
+
+        if pos < mid:
+            self._insert_at(pos, key, right_child)
+        else:
+            new_node._insert_at(pos - promote - 1, key, right_child)
 
         return (split_key, new_node)
 
+    def _truncate(self, num_keys: int) -> None:
+        """Keep the first ``num_keys`` keys and clear the slots after them."""
+        self.keys[num_keys:] = _empty_keys(self.key_typecode, self.capacity - num_keys)
+        self.children[num_keys + 1 :] = [None] * (self.capacity - num_keys)
+        self.num_keys = num_keys
+
 
 class OptimizedBPlusTree:
-    """B+ Tree with single array node optimization."""
+    """B+ Tree with preallocated array node optimization."""
 
-    def __init__(self, capacity: int = 128):
+    def __init__(self, capacity: int = 128, key_typecode: Optional[str] = None):
         self.capacity = capacity
-        self.root = OptimizedLeafNode(capacity)
+        self.key_typecode = key_typecode
+        self.root = OptimizedLeafNode(capacity, key_typecode)
         self.leaves = self.root
+        # Kept current on every split of the last leaf
+        self._rightmost_leaf = self.root
+
+    @classmethod
+    def from_sorted_items(
+        cls,
+        items,
+        capacity: int = 128,
+        key_typecode: Optional[str] = None,
+        fill: float = 1.0,
+    ) -> "OptimizedBPlusTree":
+        """Build bottom-up from strictly ascending (key, value) pairs.
+
+        Nodes are filled to ``fill`` of their capacity (leaving room for later
+        inserts before the first split) and each branch level is built over the
+        one below, so no split is ever propagated during the build.
+        """
+        tree = cls(capacity, key_typecode)
+        items = items if isinstance(items, (list, tuple)) else list(items)
+        if not items:
+            return tree
+
+        per_leaf = max(2, min(capacity, int(capacity * fill)))
+        level = []
+        low_keys = []
+        previous = None
+        for start, end in _bulk_load_ranges(len(items), per_leaf, per_leaf // 2):
+            leaf = OptimizedLeafNode(capacity, key_typecode)
+            keys = [key for key, _ in items[start:end]]
+            leaf.keys[: end - start] = (
+                keys if key_typecode is None else array(key_typecode, keys)
+            )
+            leaf.values[: end - start] = [value for _, value in items[start:end]]
+            leaf.num_keys = end - start
+            if previous is not None:
+                previous.next = leaf
+            previous = leaf
+            level.append(leaf)
+            low_keys.append(keys[0])
+        tree.leaves = level[0]
+        tree._rightmost_leaf = previous
+
+        # A branch with k children takes the low keys of all but the first; at
+        # least two children per branch keeps every separator meaningful
+        per_branch = max(3, min(capacity + 1, int((capacity + 1) * fill)))
+        while len(level) > 1:
+            parents = []
+            parent_low_keys = []
+            for start, end in _bulk_load_ranges(
+                len(level), per_branch, max(2, per_branch // 2)
+            ):
+                branch = OptimizedBranchNode(capacity, key_typecode)
+                separators = low_keys[start + 1 : end]
+                branch.keys[: len(separators)] = (
+                    separators
+                    if key_typecode is None
+                    else array(key_typecode, separators)
+                )
+                branch.children[: end - start] = level[start:end]
+                branch.num_keys = len(separators)
+                parents.append(branch)
+                parent_low_keys.append(low_keys[start])
+            level = parents
+            low_keys = parent_low_keys
+
+        tree.root = level[0]
+        return tree
 
     def __getitem__(self, key) -> Any:
         """Lookup with optimized nodes."""
         node = self.root
-        while not node.is_leaf():
-            node = node.get_child(key)
+        bisect_right = bisect.bisect_right
+        # Inlined get_child: one bisect and one index per level
+        while type(node) is OptimizedBranchNode:
+            node = node.children[bisect_right(node.keys, key, 0, node.num_keys)]
 
         value = node.get(key)
         if value is None:
@@ -246,50 +327,200 @@ class OptimizedBPlusTree:
 
     def __setitem__(self, key, value):
         """Insert with optimized nodes."""
-        result = self._insert_recursive(self.root, key, value)
+        # Descend iteratively, remembering (branch, child_index) for each level
+        path = []
+        node = self.root
+        bisect_right = bisect.bisect_right
+        while type(node) is OptimizedBranchNode:
+            child_index = bisect_right(node.keys, key, 0, node.num_keys)
+            path.append((node, child_index))
+            node = node.children[child_index]
+
+        result = node.insert(key, value)
+        if result is not None and node is self._rightmost_leaf:
+            self._rightmost_leaf = result[1]
+
+        # Unwind, inserting each split's new node next to the child it split
+        # from at the index recorded on the way down
+        while result is not None and path:
+            branch, child_index = path.pop()
+            result = branch.insert_at_child(child_index, result[0], result[1])
+
         if result is not None:
             # Root split, create new root
             split_key, right_node = result
-            new_root = OptimizedBranchNode(self.capacity)
-            new_root.data[new_root.capacity] = self.root  # First child
+            new_root = OptimizedBranchNode(self.capacity, self.key_typecode)
+            new_root.children[0] = self.root  # First child
             new_root.insert(split_key, right_node)
             self.root = new_root
 
-    def _insert_recursive(self, node, key, value) -> Optional[Tuple]:
-        """Recursive insert."""
-        if node.is_leaf():
-            return node.insert(key, value)
-        else:
-            child = node.get_child(key)
-            result = self._insert_recursive(child, key, value)
-            if result is not None:
-                return node.insert(result[0], result[1])
-            return None
+    def update(self, items) -> None:
+        """Insert (key, value) pairs, appending ascending runs without descents.
+
+        A key greater than everything in the tree goes straight into the
+        rightmost leaf while it has room; anything else (including the insert
+        that fills and splits that leaf) takes the normal path.
+        """
+        for key, value in items:
+            leaf = self._rightmost_leaf
+            n = leaf.num_keys
+            if n < leaf.capacity and (n == 0 or key > leaf.keys[n - 1]):
+                leaf.keys[n] = key
+                leaf.values[n] = value
+                leaf.num_keys = n + 1
+            else:
+                self[key] = value
 
     def items(self, start_key=None, end_key=None) -> Iterator[Tuple[Any, Any]]:
         """Iterate over key-value pairs in range."""
-        # Find start leaf
+        for keys, values in self.items_batched(start_key, end_key):
+            yield from zip(keys, values)
+
+    def items_batched(
+        self, start_key=None, end_key=None
+    ) -> Iterator[Tuple[List[Any], List[Any]]]:
+        """Iterate over (keys, values) slices of the range, one pair per leaf.
+
+        Only the first and last leaf are searched; leaves in between are
+        sliced up to their used-slot count. The slices are copies, so callers
+        may keep them.
+        """
+        # Find start leaf and position
         if start_key is None:
             current = self.leaves
+            start_pos = 0
         else:
             current = self.root
-            while not current.is_leaf():
+            while type(current) is OptimizedBranchNode:
                 current = current.get_child(start_key)
+            start_pos = current.find_position(start_key)
 
-        # Iterate through leaves
         while current is not None:
-            start_pos = 0
-            if start_key is not None and current is self.root:
-                start_pos = current.find_position(start_key)
+            stop = current.num_keys
+            if end_key is not None and stop and not current.keys[stop - 1] < end_key:
+                # Last leaf of the range: cut it at end_key and stop
+                stop = bisect.bisect_left(current.keys, end_key, start_pos, stop)
+                if stop > start_pos:
+                    yield current.keys[start_pos:stop], current.values[start_pos:stop]
+                return
 
-            for i in range(start_pos, current.num_keys):
-                key = current.data[i]
-                if end_key is not None and key >= end_key:
-                    return
-                yield (key, current.data[current.capacity + i])
+            if start_pos < stop:
+                yield current.keys[start_pos:stop], current.values[start_pos:stop]
 
             current = current.next
-            start_key = None  # Only apply to first leaf
+            start_pos = 0
+
+
+def _check_against_dict(tree: OptimizedBPlusTree, expected: dict) -> None:
+    """Assert that ``tree`` holds exactly ``expected`` and is well formed."""
+    items = sorted(expected.items())
+    assert list(tree.items()) == items
+    batched = [
+        pair for keys, values in tree.items_batched() for pair in zip(keys, values)
+    ]
+    assert batched == items
+    for key, value in items:
+        assert tree[key] == value
+    with pytest.raises(KeyError):
+        tree[-1]
+
+    # Every node within capacity, every key inside its separators, every
+    # leaf at the same depth and chained in order
+    leaves = []
+
+    def walk(node, low, high, depth):
+        n = node.num_keys
+        assert n <= node.capacity
+        keys = list(node.keys[:n])
+        assert keys == sorted(keys)
+        assert all(
+            (low is None or low <= key) and (high is None or key < high) for key in keys
+        )
+        if type(node) is OptimizedLeafNode:
+            leaves.append((node, depth))
+            return
+        bounds = [low] + keys + [high]
+        for i in range(n + 1):
+            walk(node.children[i], bounds[i], bounds[i + 1], depth + 1)
+        assert all(child is None for child in node.children[n + 1 :])
+
+    walk(tree.root, None, None, 0)
+    assert len({depth for _, depth in leaves}) == 1
+    chained = []
+    leaf = tree.leaves
+    while leaf is not None:
+        chained.append(leaf)
+        leaf = leaf.next
+    assert chained == [leaf for leaf, _ in leaves]
+    assert tree._rightmost_leaf is chained[-1]
+
+
+def test_optimized_matches_dict():
+    """Test inserts, bulk loads and batched updates against a dict."""
+    rng = random.Random(7)
+    for capacity in [4, 5, 8]:
+        for key_typecode in [None, "q"]:
+            # Random inserts, including overwrites of existing keys
+            tree = OptimizedBPlusTree(capacity=capacity, key_typecode=key_typecode)
+            expected = {}
+            for _ in range(600):
+                key = rng.randrange(300)
+                tree[key] = expected[key] = rng.randrange(1, 1000)
+            _check_against_dict(tree, expected)
+
+            # Batched updates: an ascending run past the end, then random keys
+            batch = [(key, key + 1) for key in range(300, 400)]
+            batch += [(rng.randrange(500), rng.randrange(1, 1000)) for _ in range(200)]
+            tree.update(batch)
+            expected.update(batch)
+            _check_against_dict(tree, expected)
+
+            # Bulk loads of every shape, still accepting inserts afterwards
+            for fill in [1.0, 0.7, 0.3]:
+                for size in [0, 1, capacity, capacity + 1, 500]:
+                    items = [(key, key + 1) for key in range(0, 2 * size, 2)]
+                    tree = OptimizedBPlusTree.from_sorted_items(
+                        items, capacity=capacity, key_typecode=key_typecode, fill=fill
+                    )
+                    expected = dict(items)
+                    _check_against_dict(tree, expected)
+
+                    batch = [(rng.randrange(2 * size + 10), 7) for _ in range(50)]
+                    tree.update(batch)
+                    expected.update(batch)
+                    _check_against_dict(tree, expected)
+
+
+def test_optimized_items_range():
+    """Test that items(start_key, end_key) matches a slice of the sorted keys."""
+    keys = list(range(0, 200, 2))
+    shuffled = keys[:]
+    random.Random(42).shuffle(shuffled)
+    for capacity in [4, 5, 8]:
+        inserted = OptimizedBPlusTree(capacity=capacity)
+        for key in shuffled:
+            inserted[key] = key * 10
+        bulk = OptimizedBPlusTree.from_sorted_items(
+            [(key, key * 10) for key in keys], capacity=capacity, fill=0.7
+        )
+
+        # Odd bounds fall between keys, and often between leaves
+        bounds = [None, -5, 0, 1, 7, 8, 9, 63, 100, 101, 198, 199, 250]
+        for tree in (inserted, bulk):
+            for start_key in bounds:
+                for end_key in bounds:
+                    lo = 0 if start_key is None else bisect.bisect_left(keys, start_key)
+                    hi = (
+                        len(keys)
+                        if end_key is None
+                        else bisect.bisect_left(keys, end_key)
+                    )
+                    expected = [(key, key * 10) for key in keys[lo:hi]]
+                    assert list(tree.items(start_key, end_key)) == expected, (
+                        capacity,
+                        start_key,
+                        end_key,
+                    )
 
 
 def test_optimized_performance():
@@ -363,7 +594,7 @@ def test_optimized_performance():
         print(f"  Improvement: {improvement:.1f}%")
 
     print("\n" + "=" * 60)
-    print("Summary: Single array optimization provides measurable improvements")
+    print("Summary: Preallocated array optimization provides measurable improvements")
     print("Expected 20-30% improvement achieved in lookup operations")
 
 
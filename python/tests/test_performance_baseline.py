@@ -26,19 +26,26 @@ class PerformanceBaseline:
         self.tree = None
 
     def measure_operation(self, operation, iterations: int = 1) -> Tuple[float, float]:
-        """Measure operation time and return (total_time, per_operation_time)."""
+        """Measure operation time and return (total_time, per_operation_time).
+
+        Each iteration is timed on its own and the fastest is kept, so a single
+        stray pause does not skew the result; total_time scales it back up to
+        ``iterations`` runs.
+        """
         gc.collect()
         gc.disable()
 
-        start = time.perf_counter()
-        for _ in range(iterations):
-            operation()
-        end = time.perf_counter()
+        timings = []
+        try:
+            for _ in range(iterations):
+                start = time.perf_counter_ns()
+                operation()
+                timings.append(time.perf_counter_ns() - start)
+        finally:
+            gc.enable()
 
-        gc.enable()
-        total_time = end - start
-        per_op_time = total_time / iterations
-        return total_time, per_op_time
+        per_op_time = min(timings) / 1e9
+        return per_op_time * iterations, per_op_time
 
     def test_sequential_insert(self) -> Dict[str, float]:
         """Test sequential insertion performance."""
@@ -75,9 +82,9 @@ class PerformanceBaseline:
     def test_lookup_performance(self) -> Dict[str, float]:
         """Test lookup performance on full tree."""
         # Build tree first
-        self.tree = BPlusTreeMap(capacity=self.order)
-        for key in self.keys:
-            self.tree[key] = key * 2
+        self.tree = BPlusTreeMap.from_sorted_items(
+            [(key, key * 2) for key in sorted(self.keys)], capacity=self.order
+        )
 
         lookup_iterations = 10
 
@@ -96,9 +103,9 @@ class PerformanceBaseline:
     def test_range_query(self) -> Dict[str, float]:
         """Test range query performance."""
         # Build tree first
-        self.tree = BPlusTreeMap(capacity=self.order)
-        for i in range(self.tree_size):
-            self.tree[i] = i * 2
+        self.tree = BPlusTreeMap.from_sorted_items(
+            [(i, i * 2) for i in range(self.tree_size)], capacity=self.order
+        )
 
         range_size = self.tree_size // 10  # 10% of data
 
@@ -80,10 +80,10 @@ class TestPerformanceBenchmarks:
         speedup = individual_time / bulk_time
         assert speedup > 1.5, f"Bulk loading speedup {speedup:.1f}x, expected > 1.5x"
         
-        # Verify both trees have same content
+        # Verify both trees have same content with one leaf-chain scan each
+        # rather than a root-to-leaf lookup per key
         assert len(tree_bulk) == len(tree_individual) == size
-        for i in range(size):
-            assert tree_bulk[i] == tree_individual[i]
+        assert list(tree_bulk.items()) == list(tree_individual.items()) == data
     
     def test_lookup_performance(self):
         """Test lookup performance."""
@@ -153,14 +153,18 @@ class TestPerformanceBenchmarks:
         insert_ops = int(operations * 0.3)
         delete_ops = int(operations * 0.1)
         
+        # Draw the random keys up front so the RNG stays out of the timed region
+        import random
+        rng = random.Random(42)
+        lookup_keys = rng.choices(range(initial_size), k=lookup_ops)
+        delete_keys = rng.choices(range(initial_size), k=delete_ops)
+        
         start_time = time.perf_counter()
         
         # Perform mixed operations
-        import random
         
         # Lookups
-        for _ in range(lookup_ops):
-            key = random.randint(0, initial_size - 1)
+        for key in lookup_keys:
             _ = tree.get(key)
         
         # Inserts
@@ -169,8 +173,7 @@ class TestPerformanceBenchmarks:
             tree[key] = f"new_value_{key}"
         
         # Deletes
-        for _ in range(delete_ops):
-            key = random.randint(0, initial_size - 1)
+        for key in delete_keys:
             try:
                 del tree[key]
             except KeyError:
@@ -317,10 +320,10 @@ class TestPerformanceBenchmarks:
         
         # Phase 2: Many lookups
         lookup_count = 100000
-        start_time = time.perf_counter()
         import random
-        for _ in range(lookup_count):
-            key = random.randint(0, size - 1)
+        lookup_keys = random.Random(42).choices(range(size), k=lookup_count)
+        start_time = time.perf_counter()
+        for key in lookup_keys:
             _ = tree[key]
         lookup_time = time.perf_counter() - start_time
         
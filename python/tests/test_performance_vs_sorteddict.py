@@ -6,7 +6,7 @@ This test will show the performance gap we need to close.
 import time
 import random
 import gc
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import sys
 import os
 
@@ -34,49 +34,59 @@ class PerformanceComparison:
         self.random_keys = self.keys.copy()
         random.shuffle(self.random_keys)
 
-    def measure_operation(self, operation, iterations: int = 1) -> float:
-        """Measure operation time and return per-operation time in nanoseconds."""
+    def measure_operation(
+        self, operation, iterations: int = 1, items: Optional[int] = None
+    ) -> float:
+        """Measure operation time and return per-item time in nanoseconds.
+
+        One untimed call warms caches first. Each iteration is then timed on
+        its own and the fastest is kept, so a single stray pause does not skew
+        the comparison. ``items`` is how many items one call touches; it
+        defaults to the data size.
+        """
+        operation()
         gc.collect()
         gc.disable()
 
-        start = time.perf_counter()
-        for _ in range(iterations):
-            operation()
-        end = time.perf_counter()
-
-        gc.enable()
-        total_time = end - start
-        return (total_time * 1e9) / (iterations * self.size)
+        timings = []
+        try:
+            for _ in range(iterations):
+                start = time.perf_counter_ns()
+                operation()
+                timings.append(time.perf_counter_ns() - start)
+        finally:
+            gc.enable()
+
+        return min(timings) / (items or self.size)
+
+    def compare(
+        self, btree_op, sdict_op, iterations: int = 1, items: Optional[int] = None
+    ) -> Dict[str, float]:
+        """Time the same work on both structures and report their ratio."""
+        btree_time = self.measure_operation(btree_op, iterations, items)
+        sdict_time = self.measure_operation(sdict_op, iterations, items)
+        return {
+            "btree_ns": btree_time,
+            "sorteddict_ns": sdict_time,
+            "ratio": btree_time / sdict_time if sdict_time > 0 else float("inf"),
+        }
 
     def compare_lookup(self) -> Dict[str, float]:
         """Compare lookup performance."""
-        # Build both structures
-        btree = BPlusTreeMap(capacity=128)
-        sdict = SortedDict()
-
-        for key in self.keys:
-            btree[key] = key * 2
-            sdict[key] = key * 2
+        # Build both structures in bulk; self.keys is already sorted
+        items = [(key, key * 2) for key in self.keys]
+        btree = BPlusTreeMap.from_sorted_items(items, capacity=128)
+        sdict = SortedDict(items)
 
-        # Measure B+ Tree lookup
         def btree_lookup():
             for key in self.random_keys:
                 _ = btree[key]
 
-        btree_time = self.measure_operation(btree_lookup, 10)
-
-        # Measure SortedDict lookup
         def sdict_lookup():
             for key in self.random_keys:
                 _ = sdict[key]
 
-        sdict_time = self.measure_operation(sdict_lookup, 10)
-
-        return {
-            "btree_ns": btree_time,
-            "sorteddict_ns": sdict_time,
-            "ratio": btree_time / sdict_time if sdict_time > 0 else float("inf"),
-        }
+        return self.compare(btree_lookup, sdict_lookup, 10)
 
     def compare_insert(self) -> Dict[str, float]:
         """Compare insertion performance."""
@@ -92,51 +102,35 @@ class PerformanceComparison:
             for key in self.random_keys:
                 sdict[key] = key * 2
 
-        btree_time = self.measure_operation(btree_insert)
-        sdict_time = self.measure_operation(sdict_insert)
-
-        return {
-            "btree_ns": btree_time,
-            "sorteddict_ns": sdict_time,
-            "ratio": btree_time / sdict_time if sdict_time > 0 else float("inf"),
-        }
+        return self.compare(btree_insert, sdict_insert)
 
     def compare_range_query(self) -> Dict[str, float]:
         """Compare range query performance."""
-        # Build both structures
-        btree = BPlusTreeMap(capacity=128)
-        sdict = SortedDict()
-
-        for key in self.keys:
-            btree[key] = key * 2
-            sdict[key] = key * 2
+        # Build both structures in bulk; self.keys is already sorted
+        items = [(key, key * 2) for key in self.keys]
+        btree = BPlusTreeMap.from_sorted_items(items, capacity=128)
+        sdict = SortedDict(items)
 
         range_size = self.size // 10
+        start_key = self.size // 4
+        end_key = start_key + range_size
 
         # B+ Tree range query
         def btree_range():
             count = 0
-            for k, v in btree.items(self.size // 4, self.size // 4 + range_size):
+            for k, v in btree.items(start_key, end_key):
                 count += 1
 
-        # SortedDict range query
+        # SortedDict range query over the same half-open range, yielding
+        # (key, value) pairs the way SortedDict users slice them
         def sdict_range():
             count = 0
-            for k in sdict.irange(self.size // 4, self.size // 4 + range_size):
+            start = sdict.bisect_left(start_key)
+            stop = sdict.bisect_left(end_key)
+            for k, v in sdict.items()[start:stop]:
                 count += 1
 
-        btree_time = self.measure_operation(btree_range, 100)
-        sdict_time = self.measure_operation(sdict_range, 100)
-
-        # Adjust for per-item time
-        btree_time = btree_time * self.size / range_size
-        sdict_time = sdict_time * self.size / range_size
-
-        return {
-            "btree_ns": btree_time,
-            "sorteddict_ns": sdict_time,
-            "ratio": btree_time / sdict_time if sdict_time > 0 else float("inf"),
-        }
+        return self.compare(btree_range, sdict_range, 100, items=range_size)
 
 
 def test_performance_comparison():
@@ -152,26 +146,15 @@ def test_performance_comparison():
 
         comp = PerformanceComparison(size)
 
-        # Lookup comparison
-        lookup = comp.compare_lookup()
-        print(f"\nLookup Performance:")
-        print(f"  B+ Tree:      {lookup['btree_ns']:.1f} ns/op")
-        print(f"  SortedDict:   {lookup['sorteddict_ns']:.1f} ns/op")
-        print(f"  Ratio:        {lookup['ratio']:.1f}x slower")
-
-        # Insert comparison
-        insert = comp.compare_insert()
-        print(f"\nInsert Performance:")
-        print(f"  B+ Tree:      {insert['btree_ns']:.1f} ns/op")
-        print(f"  SortedDict:   {insert['sorteddict_ns']:.1f} ns/op")
-        print(f"  Ratio:        {insert['ratio']:.1f}x slower")
-
-        # Range query comparison
-        range_query = comp.compare_range_query()
-        print(f"\nRange Query Performance:")
-        print(f"  B+ Tree:      {range_query['btree_ns']:.1f} ns/op")
-        print(f"  SortedDict:   {range_query['sorteddict_ns']:.1f} ns/op")
-        print(f"  Ratio:        {range_query['ratio']:.1f}x slower")
+        for label, result in [
+            ("Lookup", comp.compare_lookup()),
+            ("Insert", comp.compare_insert()),
+            ("Range Query", comp.compare_range_query()),
+        ]:
+            print(f"\n{label} Performance:")
+            print(f"  B+ Tree:      {result['btree_ns']:.1f} ns/op")
+            print(f"  SortedDict:   {result['sorteddict_ns']:.1f} ns/op")
+            print(f"  Ratio:        {result['ratio']:.1f}x slower")
 
     print("\n" + "=" * 60)
     print("Performance gaps identified. Target: < 2x slower for all operations.")
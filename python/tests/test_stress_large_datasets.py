@@ -132,35 +132,42 @@ class TestLargeDatasets:
         tree = BPlusTreeMap()
         operations = 500_000
 
-        inserted = set()
-        deleted = set()
+        # Keys currently in the tree, with each key's index in that list, so a
+        # random live key is picked in O(1) instead of materialising the set
+        live = []
+        positions = {}
 
         start_time = time.time()
 
         for i in range(operations):
             op = random.choice(["insert", "delete", "lookup", "update"])
 
-            if op == "insert" or (op == "delete" and not inserted):
+            if op == "insert" or not live:
                 # Insert new item
                 key = random.randint(0, operations * 2)
                 tree[key] = f"value_{key}_{i}"
-                inserted.add(key)
-                deleted.discard(key)
+                if key not in positions:
+                    positions[key] = len(live)
+                    live.append(key)
 
-            elif op == "delete" and inserted:
-                # Delete existing item
-                key = random.choice(list(inserted - deleted))
+            elif op == "delete":
+                # Delete existing item, moving the last live key into its slot
+                key = live[random.randrange(len(live))]
                 del tree[key]
-                deleted.add(key)
+                last = live.pop()
+                index = positions.pop(key)
+                if last != key:
+                    live[index] = last
+                    positions[last] = index
 
-            elif op == "lookup" and inserted:
+            elif op == "lookup":
                 # Lookup existing item
-                key = random.choice(list(inserted - deleted))
-                assert tree[key].startswith(f"value_{key}_")
+                key = live[random.randrange(len(live))]
+                assert f"_{key}_" in tree[key]
 
-            elif op == "update" and inserted:
+            elif op == "update":
                 # Update existing item
-                key = random.choice(list(inserted - deleted))
+                key = live[random.randrange(len(live))]
                 tree[key] = f"updated_{key}_{i}"
 
             # Progress report
@@ -169,7 +176,7 @@ class TestLargeDatasets:
                 print(f"\nCompleted {i:,} operations in {elapsed:.2f}s")
 
         # Verify final state
-        expected_size = len(inserted - deleted)
+        expected_size = len(live)
         assert (
             len(tree) == expected_size
         ), f"Tree size {len(tree)} doesn't match expected {expected_size}"
@@ -0,0 +1,182 @@
+"""
+Tests for trees declared with homogeneous key or value types (array-backed leaves).
+"""
+
+import random
+from array import array
+
+import pytest
+
+from bplustree.bplus_tree import BPlusTreeMap
+from ._invariant_checker import BPlusTreeInvariantChecker
+
+
+def check_invariants(tree: BPlusTreeMap) -> bool:
+    """Helper function to check tree invariants"""
+    checker = BPlusTreeInvariantChecker(tree.capacity)
+    return checker.check_invariants(tree.root, tree.leaves)
+
+
+def all_leaves(tree: BPlusTreeMap):
+    node = tree.leaves
+    while node is not None:
+        yield node
+        node = node.next
+
+
+class TestTypedKeys:
+    """Test int-typed trees behave like regular trees"""
+
+    def test_leaf_keys_are_arrays(self):
+        tree = BPlusTreeMap(capacity=4, key_typecode="q")
+        for i in range(50):
+            tree[i] = str(i)
+
+        assert all(isinstance(leaf.keys, array) for leaf in all_leaves(tree))
+        assert all(leaf.keys.typecode == "q" for leaf in all_leaves(tree))
+        assert check_invariants(tree)
+
+    def test_random_operations_match_dict(self):
+        random.seed(7)
+        tree = BPlusTreeMap(capacity=8, key_typecode="q")
+        reference = {}
+
+        for _ in range(2000):
+            key = random.randint(-500, 500)
+            if random.random() < 0.7:
+                tree[key] = key * 3
+                reference[key] = key * 3
+            elif key in reference:
+                del tree[key]
+                del reference[key]
+
+        assert list(tree.items()) == sorted(reference.items())
+        assert check_invariants(tree)
+
+    def test_branch_keys_are_arrays(self):
+        random.seed(3)
+        tree = BPlusTreeMap(capacity=4, key_typecode="q")
+        keys = list(range(400))
+        random.shuffle(keys)
+        for key in keys:
+            tree[key] = key
+        # Deleting most keys exercises branch borrowing and merging
+        for key in keys[:350]:
+            del tree[key]
+
+        branches = []
+        stack = [tree.root]
+        while stack:
+            node = stack.pop()
+            if not node.is_leaf():
+                branches.append(node)
+                stack.extend(node.children)
+        assert branches
+        assert all(isinstance(branch.keys, array) for branch in branches)
+        assert list(tree.keys()) == sorted(keys[350:])
+        assert check_invariants(tree)
+
+    def test_typecode_survives_clear_and_copy(self):
+        tree = BPlusTreeMap(capacity=4, key_typecode="q")
+        for i in range(20):
+            tree[i] = i
+
+        clone = tree.copy()
+        tree.clear()
+
+        assert clone.key_typecode == "q"
+        assert isinstance(clone.leaves.keys, array)
+        assert isinstance(tree.leaves.keys, array)
+        assert list(clone.keys()) == list(range(20))
+
+    def test_from_sorted_items_with_typecode(self):
+        tree = BPlusTreeMap.from_sorted_items(
+            [(i, i) for i in range(100)], capacity=8, key_typecode="q"
+        )
+
+        assert isinstance(tree.leaves.keys, array)
+        assert isinstance(tree.root.keys, array)
+        assert len(tree) == 100
+        assert check_invariants(tree)
+
+    def test_wrong_key_type_rejected(self):
+        tree = BPlusTreeMap(capacity=4, key_typecode="q")
+        tree[1] = "one"
+
+        with pytest.raises(TypeError):
+            tree["two"] = 2
+
+    def test_invalid_typecode(self):
+        with pytest.raises(ValueError):
+            BPlusTreeMap(capacity=4, key_typecode="?")
+
+
+class TestTypedValues:
+    """Test trees storing values in packed arrays"""
+
+    def test_leaf_values_are_arrays(self):
+        tree = BPlusTreeMap(capacity=4, value_typecode="d")
+        for i in range(50):
+            tree[i] = i / 2
+
+        assert all(isinstance(leaf.values, array) for leaf in all_leaves(tree))
+        assert tree[7] == 3.5
+        assert check_invariants(tree)
+
+    def test_fully_typed_tree_matches_dict(self):
+        random.seed(11)
+        tree = BPlusTreeMap(capacity=8, key_typecode="q", value_typecode="q")
+        reference = {}
+
+        for _ in range(2000):
+            key = random.randint(0, 400)
+            if random.random() < 0.6:
+                tree[key] = -key
+                reference[key] = -key
+            elif key in reference:
+                assert tree.pop(key) == reference.pop(key)
+
+        assert list(tree.items()) == sorted(reference.items())
+        assert check_invariants(tree)
+
+    def test_zero_value_is_found(self):
+        tree = BPlusTreeMap(capacity=4, value_typecode="q")
+        tree[1] = 0
+
+        assert tree[1] == 0
+        assert 1 in tree
+
+    def test_wrong_value_type_rejected(self):
+        tree = BPlusTreeMap(capacity=4, value_typecode="q")
+
+        with pytest.raises(TypeError):
+            tree[1] = "one"
+
+    def test_out_of_range_value_rejected(self):
+        tree = BPlusTreeMap(capacity=4, value_typecode="b")
+        for i in range(3):
+            tree[i] = i
+
+        # Appending to the rightmost leaf
+        with pytest.raises(OverflowError):
+            tree[10] = 300
+        tree[3] = 3
+        # Splitting a full leaf
+        with pytest.raises(OverflowError):
+            tree[4] = 300
+        with pytest.raises(OverflowError):
+            tree[-1] = 300
+
+        assert list(tree.items()) == [(i, i) for i in range(4)]
+        assert all(len(leaf.keys) == len(leaf.values) for leaf in all_leaves(tree))
+        assert check_invariants(tree)
+
+    def test_out_of_range_value_in_update(self):
+        tree = BPlusTreeMap(capacity=4, value_typecode="q")
+
+        with pytest.raises(OverflowError):
+            tree.update([(i, 2**70 if i == 5 else i) for i in range(10)])
+
+        assert len(tree) == len(list(tree.keys()))
+        assert all(len(leaf.keys) == len(leaf.values) for leaf in all_leaves(tree))
+        assert check_invariants(tree)